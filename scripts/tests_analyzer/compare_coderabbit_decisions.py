@@ -15,6 +15,7 @@ Usage:
     uv run python scripts/tests_analyzer/compare_coderabbit_decisions.py --verbose
     uv run python scripts/tests_analyzer/compare_coderabbit_decisions.py --detailed  # Include full dependency analysis
     uv run python scripts/tests_analyzer/compare_coderabbit_decisions.py --output-file report.md --detailed
+    uv run python scripts/tests_analyzer/compare_coderabbit_decisions.py --parallel-prs 2
 """
 
 from __future__ import annotations
@@ -29,8 +30,10 @@ import subprocess
 import sys
 import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -40,8 +43,13 @@ from simple_logger.logger import get_logger
 logger = get_logger(name=__name__, level=logging.INFO)
 
 
+@cache
 def get_default_repo() -> str:
-    """Try to detect repo from git remote, fallback to hardcoded default."""
+    """Try to detect repo from git remote, fallback to hardcoded default.
+
+    Resolved on first use rather than at import time, so importing this module
+    does not spawn git.
+    """
     git_path = shutil.which("git")
     if not git_path:
         return "RedHatQE/openshift-virtualization-tests"
@@ -57,7 +65,7 @@ def get_default_repo() -> str:
         if result.returncode == 0:
             url = result.stdout.strip()
             # Parse git@github.com:owner/repo.git or https://github.com/owner/repo
-            match = re.search(r"github\.com[:/]([^/]+/[^/\.]+)", url)
+            match = GITHUB_REMOTE_PATTERN.search(url)
             if match:
                 return match.group(1).rstrip(".git")
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, OSError) as exc:
@@ -66,7 +74,6 @@ def get_default_repo() -> str:
 
 
 # Constants
-DEFAULT_REPO = get_default_repo()
 GITHUB_API_BASE = "https://api.github.com"
 CODERABBIT_BOT = "coderabbitai[bot]"
 
@@ -76,8 +83,14 @@ TEST_PLAN_PATTERN = re.compile(r"(?:#{1,3}|\*\*)\s*Test Execution Plan\s*(?:\*\*
 # Pattern to find smoke test decision (various formats)
 SMOKE_TEST_PATTERN = re.compile(r"(?:\*\*)?Run smoke tests:?\s*(?:\*\*)?\s*[`*]*(True|False)[`*]*", re.IGNORECASE)
 
+# Pattern to extract owner/repo from a GitHub remote URL
+GITHUB_REMOTE_PATTERN = re.compile(r"github\.com[:/]([^/]+/[^/\.]+)")
+
+# Pattern for a valid owner/repo name
+REPO_NAME_PATTERN = re.compile(r"^[\w.-]+/[\w.-]+$")
+
 
-@dataclass
+@dataclass(slots=True)
 class CodeRabbitDecision:
     """Represents CodeRabbit's decision from a PR comment."""
 
@@ -87,7 +100,7 @@ class CodeRabbitDecision:
     comment_body: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalyzerDecision:
     """Represents the local analyzer's decision."""
 
@@ -102,7 +115,7 @@ class AnalyzerDecision:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Result of comparing CodeRabbit vs Analyzer for a single PR."""
 
@@ -351,7 +364,7 @@ def run_analyzer(repo: str, pr_number: int, token: str | None = None) -> Analyze
         )
 
     # Validate repo format to prevent command injection
-    if not re.match(r"^[\w.-]+/[\w.-]+$", repo):
+    if not REPO_NAME_PATTERN.match(repo):
         return AnalyzerDecision(
             success=False,
             error=f"Invalid repository format: {repo}",
@@ -493,13 +506,13 @@ def compare_pr(
 
 def generate_detailed_mismatch_analysis(result: ComparisonResult) -> list[str]:
     """Generate detailed analysis for a mismatch case."""
-    lines = []
-
-    lines.append(f"### PR #{result.pr_number} - [{result.pr_title}]({result.pr_url})")
-    lines.append("")
-    lines.append(f"**Author:** {result.pr_author}")
-    lines.append(f"**CodeRabbit decision:** {'Run' if result.coderabbit.should_run else 'Skip'}")
-    lines.append(f"**Analyzer decision:** {'Run' if result.analyzer.should_run else 'Skip'}")
+    lines = [
+        f"### PR #{result.pr_number} - [{result.pr_title}]({result.pr_url})",
+        "",
+        f"**Author:** {result.pr_author}",
+        f"**CodeRabbit decision:** {'Run' if result.coderabbit.should_run else 'Skip'}",
+        f"**Analyzer decision:** {'Run' if result.analyzer.should_run else 'Skip'}",
+    ]
     if result.analyzer.marker_expression:
         lines.append(f"**Marker expression:** `{result.analyzer.marker_expression}`")
     lines.append("")
@@ -507,8 +520,7 @@ def generate_detailed_mismatch_analysis(result: ComparisonResult) -> list[str]:
     # Show changed files
     if result.analyzer.changed_files:
         lines.append(f"**Changed files ({len(result.analyzer.changed_files)}):**")
-        for file in result.analyzer.changed_files[:10]:  # Limit to first 10
-            lines.append(f"- `{file}`")
+        lines.extend(f"- `{file}`" for file in result.analyzer.changed_files[:10])  # Limit to first 10
         if len(result.analyzer.changed_files) > 10:
             lines.append(f"- _(and {len(result.analyzer.changed_files) - 10} more)_")
         lines.append("")
@@ -529,8 +541,7 @@ def generate_detailed_mismatch_analysis(result: ComparisonResult) -> list[str]:
         lines.append("")
 
     # Show analyzer reasoning
-    lines.append(f"**Analyzer reasoning:** {result.analyzer.reason}")
-    lines.append("")
+    lines.extend([f"**Analyzer reasoning:** {result.analyzer.reason}", ""])
 
     return lines
 
@@ -546,12 +557,21 @@ def generate_markdown_report(results: list[ComparisonResult], repo: str, *, deta
         "",
     ]
 
-    # Summary statistics
-    with_coderabbit = [result for result in results if result.coderabbit.found]
-    with_analyzer = [result for result in results if result.analyzer.success]
-    comparable = [result for result in results if result.match is not None]
-    matches = [result for result in comparable if result.match]
-    mismatches = [result for result in comparable if not result.match]
+    # Summary statistics, bucketed in a single pass over the results
+    matches: list[ComparisonResult] = []
+    mismatches: list[ComparisonResult] = []
+    no_coderabbit: list[ComparisonResult] = []
+    errors: list[ComparisonResult] = []
+    for result in results:
+        if result.match is True:
+            matches.append(result)
+        elif result.match is False:
+            mismatches.append(result)
+        if not result.coderabbit.found:
+            no_coderabbit.append(result)
+        if not result.analyzer.success:
+            errors.append(result)
+    comparable_count = len(matches) + len(mismatches)
 
     lines.extend([
         "## Summary",
@@ -559,18 +579,17 @@ def generate_markdown_report(results: list[ComparisonResult], repo: str, *, deta
         "| Metric | Count |",
         "|--------|-------|",
         f"| Total PRs | {len(results)} |",
-        f"| PRs with CodeRabbit decision | {len(with_coderabbit)} |",
-        f"| PRs with successful analyzer run | {len(with_analyzer)} |",
-        f"| Comparable (both available) | {len(comparable)} |",
+        f"| PRs with CodeRabbit decision | {len(results) - len(no_coderabbit)} |",
+        f"| PRs with successful analyzer run | {len(results) - len(errors)} |",
+        f"| Comparable (both available) | {comparable_count} |",
         f"| **Matches** | {len(matches)} |",
         f"| **Mismatches** | {len(mismatches)} |",
         "",
     ])
 
-    if comparable:
-        accuracy = (len(matches) / len(comparable)) * 100
-        lines.append(f"**Agreement Rate:** {accuracy:.1f}%")
-        lines.append("")
+    if comparable_count:
+        accuracy = (len(matches) / comparable_count) * 100
+        lines.extend([f"**Agreement Rate:** {accuracy:.1f}%", ""])
 
     # Mismatches section (most important)
     if mismatches:
@@ -604,8 +623,7 @@ def generate_markdown_report(results: list[ComparisonResult], repo: str, *, deta
             ])
             for mismatch in mismatches:
                 lines.extend(generate_detailed_mismatch_analysis(result=mismatch))
-                lines.append("---")
-                lines.append("")
+                lines.extend(["---", ""])
 
     # Matches section
     if matches:
@@ -631,7 +649,6 @@ def generate_markdown_report(results: list[ComparisonResult], repo: str, *, deta
         lines.append("")
 
     # PRs without CodeRabbit decision
-    no_coderabbit = [result for result in results if not result.coderabbit.found]
     if no_coderabbit:
         lines.extend([
             "## PRs Without CodeRabbit Decision",
@@ -650,7 +667,6 @@ def generate_markdown_report(results: list[ComparisonResult], repo: str, *, deta
         lines.append("")
 
     # Analyzer errors
-    errors = [result for result in results if not result.analyzer.success]
     if errors:
         lines.extend([
             "## Analyzer Errors",
@@ -689,10 +705,11 @@ def main() -> int:
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
+    default_repo = get_default_repo()
     parser.add_argument(
         "--repo",
-        default=DEFAULT_REPO,
-        help=f"GitHub repository (default: {DEFAULT_REPO})",
+        default=default_repo,
+        help=f"GitHub repository (default: {default_repo})",
     )
     parser.add_argument(
         "--output",
@@ -722,8 +739,19 @@ def main() -> int:
         action="store_true",
         help="Include detailed dependency chain analysis for mismatches",
     )
+    parser.add_argument(
+        "--parallel-prs",
+        type=int,
+        default=1,
+        help=(
+            "Number of PRs to compare concurrently (default: 1). Each comparison runs an analyzer "
+            "subprocess with a 120s timeout and several GitHub API calls; keep this low"
+        ),
+    )
 
     args = parser.parse_args()
+    if args.parallel_prs < 1:
+        parser.error("--parallel-prs must be at least 1")
 
     # Note: verbose flag kept for backward compatibility but INFO is always used
     if args.verbose:
@@ -750,11 +778,11 @@ def main() -> int:
         prs = prs[: args.limit]
         logger.info(msg="Limited PR count", extra={"count": len(prs)})
 
-    # Compare each PR
-    results = []
-    for pr in prs:
-        result = compare_pr(repo=args.repo, pr=pr, token=token)
-        results.append(result)
+    # Compare PRs (serially by default; see --parallel-prs).  Results are
+    # collected in PR order so reports are stable
+    with ThreadPoolExecutor(max_workers=args.parallel_prs) as executor:
+        futures = [executor.submit(compare_pr, repo=args.repo, pr=pr, token=token) for pr in prs]
+        results = [future.result() for future in futures]
 
     # Generate output
     if args.output == "json":
@@ -770,14 +798,14 @@ def main() -> int:
         print(output)
 
     # Summary
-    comparable = [result for result in results if result.match is not None]
-    matches = [result for result in comparable if result.match]
+    comparable_count = sum(1 for result in results if result.match is not None)
+    match_count = sum(1 for result in results if result.match)
 
-    if comparable:
-        accuracy = (len(matches) / len(comparable)) * 100
+    if comparable_count:
+        accuracy = (match_count / comparable_count) * 100
         logger.info(
             msg="Agreement rate calculated",
-            extra={"accuracy": f"{accuracy:.1f}%", "matches": len(matches), "comparable": len(comparable)},
+            extra={"accuracy": f"{accuracy:.1f}%", "matches": match_count, "comparable": comparable_count},
         )
 
     return 0
@@ -20,6 +20,7 @@ from __future__ import annotations
 import argparse
 import ast
 import base64
+import hashlib
 import json
 import logging
 import os
@@ -28,11 +29,14 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import urllib.error
 import urllib.parse
 import urllib.request
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Any
 
@@ -51,31 +55,71 @@ MAX_CONFTEST_SEARCH_ITERATIONS = 100
 REPORT_TIMEOUT_SECONDS = 10
 MAX_FILES_PER_PR = 10000
 
+# pytest's default python_files patterns: test_*.py and *_test.py
+TEST_FILE_NAME_PATTERN = re.compile(r"test_.*\.py|.*_test\.py")
+
+# Diff parsing patterns, compiled once and reused for every diff line
+DIFF_FILE_HEADER_PATTERN = re.compile(r"^(?=diff --git )", re.MULTILINE)
+HUNK_NEW_START_PATTERN = re.compile(r"\+(\d+)")
+HUNK_FUNCTION_CONTEXT_PATTERN = re.compile(r"@@.*@@\s*(?:async\s+)?def\s+(\w+)")
+FUNCTION_DEF_PATTERN = re.compile(r"(?:async\s+)?def\s+(\w+)\s*\(")
+CLASS_DEF_PATTERN = re.compile(r"class\s+(\w+)[\s:(]")
+# A "-" line that is not a "---" file header, found without splitting the diff into lines
+DELETION_LINE_PATTERN = re.compile(r"^-(?!--)", re.MULTILINE)
+IMPORT_CONTINUATION_PATTERN = re.compile(r"^[A-Za-z_]\w*(?:\s+as\s+\w+)?\s*,\s*$")
+
+# Marker expression parsing: word tokens, minus the boolean operators
+MARKER_TOKEN_PATTERN = re.compile(r"\b\w+\b")
+MARKER_EXPRESSION_OPERATORS = frozenset({"and", "or", "not"})
+
+# "pytest --setup-plan" output patterns
+SETUP_PLAN_FIXTURE_PATTERN = re.compile(r"SETUP\s+[FSM]\s+(\w+)")
+SETUP_PLAN_TEST_ID_PATTERN = re.compile(r":\s+(tests/[^\s]+::[^\s]+)")
+
+# Input validation patterns
+REPO_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*/[a-zA-Z0-9][a-zA-Z0-9._-]*$")
+BRANCH_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9/_.-]+$")
+
+# Shell metacharacters rejected in pytest arguments
+PYTEST_ARG_FORBIDDEN_CHARS = frozenset(";|&`$\n\r")
+
+# Commands tried in order to run pytest
+PYTEST_LAUNCHERS: tuple[tuple[str, ...], ...] = (("pytest",), ("uv", "run", "pytest"))
+
 # Parallelization settings
 MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
 
+# Parsed module cache, keyed by (file path, SHA-256 of file content), in LRU
+# order.  Bounded (above the ~800 files one run parses) and cleared when
+# analyze_impact finishes, so trees do not outlive a run.  Shared across
+# worker threads, so access is guarded by a lock.
+AST_CACHE_MAX_ENTRIES = 2048
+_AST_CACHE: OrderedDict[tuple[Path, str], ast.Module] = OrderedDict()
+_AST_CACHE_LOCK = threading.Lock()
+
 
+@cache
 def validate_repo_name(repo: str) -> None:
     """Validate GitHub repo name format strictly.
 
+    Every GitHub API helper validates the same repo name, so successful
+    validations are memoized; invalid names raise on every call.
+
     Args:
         repo: Repository in owner/repo format
 
     Raises:
-        ValueError: If repo format is invalid or contains dangerous characters
+        ValueError: If repo format is invalid
     """
     if "/" not in repo or repo.count("/") != 1:
         raise ValueError(f"Invalid repo format: {repo}. Expected 'owner/repo'")
 
-    # Check for valid characters only (alphanumeric, dash, underscore, dot)
-    if not re.match(r"^[a-zA-Z0-9][a-zA-Z0-9._-]*/[a-zA-Z0-9][a-zA-Z0-9._-]*$", repo):
+    # Check for valid characters only (alphanumeric, dash, underscore, dot).
+    # fullmatch also rejects a trailing newline, so no shell metacharacter
+    # can get through.
+    if not REPO_NAME_PATTERN.fullmatch(string=repo):
         raise ValueError(f"Invalid repo format: {repo}. Contains invalid characters")
 
-    # Reject shell metacharacters that could enable command injection
-    dangerous_chars = ["`", "$", "|", "&", ";", "\n", "\r", "\\", '"', "'", "<", ">", "(", ")"]
-    if any(char in repo for char in dangerous_chars):
-        raise ValueError(f"Invalid characters in repo name: {repo}")
-
 
 def cleanup_temp_dir(temp_dir: str | None) -> None:
     """Clean up temporary directory if it exists."""
@@ -113,6 +157,25 @@ def _handle_github_api_error(e: urllib.error.HTTPError, context: str = "") -> No
         raise RuntimeError(f"GitHub API error: {e.code} {e.reason}\n{error_body}") from e
 
 
+def _github_api_headers(token: str | None) -> dict[str, str]:
+    """Build the request headers for GitHub REST API calls.
+
+    Args:
+        token: Optional GitHub token for authentication.
+
+    Returns:
+        Headers dict with ``Accept``, ``User-Agent`` and, when a token is
+        given, ``Authorization``.
+    """
+    headers = {
+        "Accept": "application/vnd.github.v3+json",
+        "User-Agent": "pytest-marker-analyzer",
+    }
+    if token:
+        headers["Authorization"] = f"token {token}"
+    return headers
+
+
 def get_pr_info(repo: str, pr_number: int, token: str | None = None) -> dict[str, Any]:
     """Get PR information including base branch.
 
@@ -122,7 +185,7 @@ def get_pr_info(repo: str, pr_number: int, token: str | None = None) -> dict[str
         token: Optional GitHub token for authentication
 
     Returns:
-        Dictionary with PR info including 'base_ref' field
+        Dictionary with PR info including 'base_ref' and 'head_sha' fields
 
     Raises:
         ValueError: If repo format is invalid or PR number is invalid
@@ -135,12 +198,7 @@ def get_pr_info(repo: str, pr_number: int, token: str | None = None) -> dict[str
 
     url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
 
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "pytest-marker-analyzer",
-    }
-    if token:
-        headers["Authorization"] = f"token {token}"
+    headers = _github_api_headers(token=token)
 
     request = urllib.request.Request(url, headers=headers)
 
@@ -155,6 +213,7 @@ def get_pr_info(repo: str, pr_number: int, token: str | None = None) -> dict[str
             return {
                 "base_ref": data["base"]["ref"],
                 "head_ref": data["head"]["ref"],
+                "head_sha": data["head"]["sha"],
                 "number": data["number"],
             }
 
@@ -192,17 +251,11 @@ def get_pr_changed_files(repo: str, pr_number: int, token: str | None = None) ->
     files = []
     page = 1
     per_page = GITHUB_API_MAX_PER_PAGE
+    headers = _github_api_headers(token=token)
 
     while True:
         url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/files?per_page={per_page}&page={page}"
 
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "pytest-marker-analyzer",
-        }
-        if token:
-            headers["Authorization"] = f"token {token}"
-
         request = urllib.request.Request(url, headers=headers)
 
         try:
@@ -258,12 +311,7 @@ def get_pr_file_diff(repo: str, pr_number: int, file_path: str, token: str | Non
         raise ValueError(f"Invalid PR number: {pr_number}. Must be positive integer")
 
     url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/files"
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "pytest-marker-analyzer",
-    }
-    if token:
-        headers["Authorization"] = f"token {token}"
+    headers = _github_api_headers(token=token)
 
     # Note: This function fetches all files but only returns diff for requested file.
     # For better efficiency with many files, could implement caching at caller level.
@@ -328,12 +376,7 @@ def _prefetch_pr_diffs(repo: str, pr_number: int, token: str | None = None) -> t
     page = 1
     per_page = GITHUB_API_MAX_PER_PAGE
 
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "pytest-marker-analyzer",
-    }
-    if token:
-        headers["Authorization"] = f"token {token}"
+    headers = _github_api_headers(token=token)
 
     while True:
         url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/files?per_page={per_page}&page={page}"
@@ -468,10 +511,9 @@ def extract_marker_names(marker_expression: str) -> set[str]:
     """
     # Remove parentheses and split by operators
     # Extract word tokens that could be markers (exclude: and, or, not)
-    tokens = re.findall(pattern=r"\b\w+\b", string=marker_expression)
+    tokens = MARKER_TOKEN_PATTERN.findall(string=marker_expression)
     # Filter out boolean operators
-    operators = {"and", "or", "not"}
-    return {token for token in tokens if token not in operators}
+    return {token for token in tokens if token not in MARKER_EXPRESSION_OPERATORS}
 
 
 def is_marker(decorator: ast.AST, marker_names: set[str]) -> bool:
@@ -648,7 +690,7 @@ def extract_usefixtures_from_decorator(decorator: ast.AST) -> set[str]:
     return fixtures
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkedTest:
     """Represents a test with specified markers and its dependencies.
 
@@ -672,7 +714,7 @@ class MarkedTest:
     symbol_imports: dict[Path, set[str]] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Results of marked test analysis."""
 
@@ -684,7 +726,7 @@ class AnalysisResult:
     total_tests: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Fixture:
     """Represents a fixture with its dependencies."""
 
@@ -694,7 +736,7 @@ class Fixture:
     function_calls: set[str] = field(default_factory=set)  # Functions it calls
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolClassification:
     """Classification of symbols in a changed file.
 
@@ -719,7 +761,7 @@ class SymbolClassification:
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassMemberInfo:
     """Tracks class members with line ranges and internal call graph."""
 
@@ -728,7 +770,7 @@ class ClassMemberInfo:
     internal_calls: dict[str, set[str]]  # method -> {self.X() callees}
 
 
-@dataclass
+@dataclass(slots=True)
 class SymbolMap:
     """Hierarchical mapping of source lines to symbols."""
 
@@ -935,6 +977,50 @@ class FixtureDefinitionVisitor(ast.NodeVisitor):
         self.generic_visit(node=node)
 
 
+def _parse_python_file(file_path: Path) -> ast.Module:
+    """Parse a Python file, reusing a previously parsed tree for identical content.
+
+    The same test files and conftests are parsed by several analysis passes
+    (marker discovery, fixture extraction, import resolution, attribute and
+    call collection).  Trees are cached by path and content hash, so a file
+    is parsed once per run and edited files are transparently re-parsed.
+    The cache is LRU-bounded by ``AST_CACHE_MAX_ENTRIES`` and emptied at the
+    end of each ``analyze_impact`` run.  Callers must treat the returned tree
+    as read-only.
+
+    Args:
+        file_path: Path to the Python file.
+
+    Returns:
+        Parsed module AST.
+
+    Raises:
+        OSError: If the file cannot be read.
+        SyntaxError: If the file is not valid Python or cannot be decoded.
+    """
+    # Raw bytes are hashed and parsed directly: no str decode/re-encode round
+    # trip, and the parser honours BOMs and PEP 263 coding declarations itself
+    source = file_path.read_bytes()
+    cache_key = (file_path, hashlib.sha256(source).hexdigest())
+    with _AST_CACHE_LOCK:
+        cached_tree = _AST_CACHE.get(cache_key)
+        if cached_tree is not None:
+            _AST_CACHE.move_to_end(cache_key)
+            return cached_tree
+    tree = ast.parse(source, filename=str(file_path))
+    with _AST_CACHE_LOCK:
+        _AST_CACHE[cache_key] = tree
+        if len(_AST_CACHE) > AST_CACHE_MAX_ENTRIES:
+            _AST_CACHE.popitem(last=False)
+    return tree
+
+
+def _clear_ast_cache() -> None:
+    """Release all cached parsed modules."""
+    with _AST_CACHE_LOCK:
+        _AST_CACHE.clear()
+
+
 def _process_test_file_for_markers(
     test_file: Path, marker_names: set[str], repo_root: Path
 ) -> list[tuple[str, str, Path]]:
@@ -950,8 +1036,7 @@ def _process_test_file_for_markers(
     """
     results = []
     try:
-        source = test_file.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(test_file))
+        tree = _parse_python_file(file_path=test_file)
 
         # Check for module-level pytestmark assignment
         module_has_marker = False
@@ -1045,8 +1130,7 @@ def _process_conftest_with_imports(
     opaque_deps: set[Path] = set()
 
     try:
-        source = conftest.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(conftest))
+        tree = _parse_python_file(file_path=conftest)
 
         # Extract fixtures
         fixture_visitor = FixtureDefinitionVisitor()
@@ -1080,8 +1164,7 @@ def _extract_imports_from_file(file_path: Path) -> set[str]:
     """
     imports = set()
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
+        tree = _parse_python_file(file_path=file_path)
         visitor = ImportVisitor()
         visitor.visit(node=tree)
         imports = visitor.imports
@@ -1102,8 +1185,7 @@ def _extract_fixtures_from_file(file_path: Path, marker_names: set[str]) -> set[
     """
     fixtures = set()
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
+        tree = _parse_python_file(file_path=file_path)
         visitor = FixtureVisitor(marker_names=marker_names)
         visitor.visit(node=tree)
         fixtures = visitor.fixtures
@@ -1112,11 +1194,14 @@ def _extract_fixtures_from_file(file_path: Path, marker_names: set[str]) -> set[
     return fixtures
 
 
+@cache
 def _resolve_module_to_path(module: str, repo_root: Path) -> Path | None:
     """Resolve a single dotted module name to a file path.
 
     Checks for a matching Python package (``__init__.py``) or module (``.py``)
     relative to *repo_root*, then falls back to the ``tests/`` subdirectory.
+    The same modules are imported by many tests and conftests, so results are
+    memoized to avoid repeating up to four filesystem lookups per import.
 
     Args:
         module: Dotted module name (e.g. ``utilities.virt``).
@@ -1214,8 +1299,7 @@ def _extract_symbol_imports_from_file(file_path: Path, repo_root: Path) -> dict[
     """
     symbol_imports: dict[Path, set[str]] = {}
     try:
-        source = file_path.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(file_path))
+        tree = _parse_python_file(file_path=file_path)
         visitor = ImportVisitor()
         visitor.visit(node=tree)
 
@@ -1228,6 +1312,39 @@ def _extract_symbol_imports_from_file(file_path: Path, repo_root: Path) -> dict[
     return symbol_imports
 
 
+def _extract_imports_with_symbols_from_file(file_path: Path, repo_root: Path) -> tuple[set[str], dict[Path, set[str]]]:
+    """Extract module imports and resolved symbol-level imports in a single pass.
+
+    Combines ``_extract_imports_from_file`` and
+    ``_extract_symbol_imports_from_file`` for callers that need both,
+    running ``ImportVisitor`` once over the file's AST.
+
+    Args:
+        file_path: Path to the Python file to analyze.
+        repo_root: Repository root path for module resolution.
+
+    Returns:
+        Tuple of (imports, symbol_imports) where imports is the set of
+        imported module names and symbol_imports maps resolved file paths
+        to the symbol names imported from them (opaque imports excluded).
+    """
+    imports: set[str] = set()
+    symbol_imports: dict[Path, set[str]] = {}
+    try:
+        tree = _parse_python_file(file_path=file_path)
+        visitor = ImportVisitor()
+        visitor.visit(node=tree)
+
+        imports = visitor.imports
+        symbol_imports, _ = _resolve_visitor_symbol_imports(visitor=visitor, repo_root=repo_root)
+    except (SyntaxError, UnicodeDecodeError, OSError) as e:  # fmt: skip
+        logger.info(
+            msg="Error extracting imports from file",
+            extra={"file": str(file_path), "error": str(e)},
+        )
+    return imports, symbol_imports
+
+
 def _symbol_start_line(node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassDef) -> int:
     """Return the start line of a symbol, including its decorators.
 
@@ -1242,6 +1359,29 @@ def _symbol_start_line(node: ast.FunctionDef | ast.AsyncFunctionDef | ast.ClassD
     return node.lineno
 
 
+def _assignment_target_names(target: ast.expr) -> list[str]:
+    """Return the names bound by a module-level assignment target.
+
+    Handles plain names as well as tuple/list unpacking
+    (``TIMEOUT, RETRIES = 60, 3`` or ``first, *rest = items``), so every
+    unpacked name is tracked as its own top-level symbol.  Attribute and
+    subscript targets bind no module-level name.
+
+    Args:
+        target: Target expression of an ``ast.Assign`` node.
+
+    Returns:
+        Names bound by the target, in source order.
+    """
+    if isinstance(target, ast.Name):
+        return [target.id]
+    if isinstance(target, ast.Starred):
+        return _assignment_target_names(target=target.value)
+    if isinstance(target, (ast.Tuple, ast.List)):
+        return [name for element in target.elts for name in _assignment_target_names(target=element)]
+    return []
+
+
 def _build_line_to_symbol_map(source: str) -> SymbolMap:
     """Build a hierarchical mapping from line ranges to symbols.
 
@@ -1283,11 +1423,11 @@ def _build_line_to_symbol_map(source: str) -> SymbolMap:
 
         elif isinstance(node, ast.Assign):
             for target in node.targets:
-                if isinstance(target, ast.Name):
+                for target_name in _assignment_target_names(target=target):
                     symbols.append((
                         node.lineno,
                         node.end_lineno or node.lineno,
-                        target.id,
+                        target_name,
                     ))
         elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
             symbols.append((
@@ -1303,11 +1443,215 @@ def _build_line_to_symbol_map(source: str) -> SymbolMap:
     )
 
 
+def _prefetch_base_sources(relative_paths: list[str], base_branch: str, repo_root: Path) -> dict[str, str | None]:
+    """Fetch the base-branch contents of several files with a single git process.
+
+    Streams ``<base_branch>:<path>`` object names through ``git cat-file --batch``
+    instead of spawning one ``git show`` per file.  The base commit itself is
+    requested first, so an unknown base ref yields an empty mapping rather
+    than every file being reported as missing (new).
+
+    Args:
+        relative_paths: File paths relative to the repository root.
+        base_branch: Base branch or ref to read the files from.
+        repo_root: Repository root path.
+
+    Returns:
+        Mapping of relative path to its base-branch source, or ``None`` when
+        the path does not exist in the base branch (new file).  Paths whose
+        content could not be read are omitted so callers fall back to a
+        per-file lookup.
+    """
+    base_sources: dict[str, str | None] = {}
+    # Object names are newline-delimited on stdin
+    requested_paths = [path for path in relative_paths if "\n" not in path]
+    if not requested_paths:
+        return base_sources
+
+    base_commit = f"{base_branch}^{{commit}}"
+    batch_input = base_commit + "\n" + "".join(f"{base_branch}:{path}\n" for path in requested_paths)
+    try:
+        result = subprocess.run(
+            ["git", "cat-file", "--batch"],
+            input=batch_input.encode(encoding="utf-8"),
+            capture_output=True,
+            cwd=repo_root,
+            timeout=30,
+        )
+    except (subprocess.SubprocessError, OSError) as exc:
+        logger.warning(msg="Error running git cat-file for base files", extra={"error": str(exc)})
+        return base_sources
+    if result.returncode != 0:
+        logger.warning(
+            msg="git cat-file failed for base files",
+            extra={"returncode": result.returncode, "stderr": result.stderr.decode(errors="replace").strip()},
+        )
+        return base_sources
+
+    # Each reply is "<sha> <type> <size>\n<content>\n" or "<object name> missing\n"
+    output = result.stdout
+    header_end = output.find(b"\n")
+    base_header_parts = output[:header_end].decode(encoding="utf-8", errors="replace").split()
+    if header_end == -1 or len(base_header_parts) != 3 or base_header_parts[1] != "commit":
+        logger.warning(msg="Base branch not found for base file lookup", extra={"base_branch": base_branch})
+        return base_sources
+    offset = header_end + 1 + int(base_header_parts[2]) + 1
+
+    for path in requested_paths:
+        header_end = output.find(b"\n", offset)
+        if header_end == -1:
+            break
+        header = output[offset:header_end].decode(encoding="utf-8", errors="replace")
+        offset = header_end + 1
+        if header.endswith(" missing"):
+            base_sources[path] = None
+            continue
+        header_parts = header.split()
+        if len(header_parts) != 3 or not header_parts[2].isdigit():
+            # Ambiguous object name or unexpected reply — leave to per-file lookup
+            continue
+        object_size = int(header_parts[2])
+        content = output[offset : offset + object_size]
+        offset += object_size + 1
+        if header_parts[1] != "blob":
+            continue
+        try:
+            base_sources[path] = content.decode(encoding="utf-8")
+        except UnicodeDecodeError:
+            continue
+
+    return base_sources
+
+
+def _base_identical_files(
+    candidate_files: list[Path], base_sources_cache: dict[str, str | None], repo_root: Path
+) -> set[Path]:
+    """Find changed files whose working-tree content equals their base-branch version.
+
+    Such files (e.g. a change that has since landed on the base branch) have
+    nothing to attribute and must not count as changed on any pathway.
+
+    Args:
+        candidate_files: Absolute paths of changed files.
+        base_sources_cache: Pre-fetched mapping of relative file paths to
+            their base-branch source.
+        repo_root: Repository root path.
+
+    Returns:
+        Subset of *candidate_files* identical to the base branch.
+    """
+    identical: set[Path] = set()
+    for file_path in candidate_files:
+        base_source = base_sources_cache.get(str(file_path.relative_to(repo_root)))
+        if base_source is None:
+            continue
+        try:
+            if file_path.read_text(encoding="utf-8") == base_source:
+                identical.add(file_path)
+        except (OSError, UnicodeDecodeError):  # fmt: skip
+            # Deleted or unreadable in the working tree — it did change
+            continue
+    return identical
+
+
+def _split_diff_by_file(diff_output: str) -> dict[str, str]:
+    """Split a multi-file unified diff into per-file sections.
+
+    Each section is keyed by its new-side path, or by its old-side path when
+    the file was deleted.  Sections without ``---``/``+++`` headers (binary
+    files, mode-only changes) and sections with quoted paths are skipped.
+
+    Args:
+        diff_output: Output of ``git diff`` produced with ``a/`` and ``b/``
+            path prefixes.
+
+    Returns:
+        Mapping of relative file path to its unified diff section.
+    """
+    file_diffs: dict[str, str] = {}
+    for section in DIFF_FILE_HEADER_PATTERN.split(string=diff_output):
+        old_path: str | None = None
+        new_path: str | None = None
+        # Only the header block is scanned; hunk bodies are never split into lines
+        hunk_start = section.find("\n@@")
+        header_block = section if hunk_start == -1 else section[:hunk_start]
+        for line in header_block.splitlines():
+            if line.startswith("--- "):
+                # git appends a tab to header paths that contain spaces
+                old_path = line[4:].rstrip("\t")
+            elif line.startswith("+++ "):
+                new_path = line[4:].rstrip("\t")
+                break
+        if old_path is None or new_path is None:
+            continue
+        if new_path.startswith("b/"):
+            file_diffs[new_path[2:]] = section
+        elif new_path == "/dev/null" and old_path.startswith("a/"):
+            file_diffs[old_path[2:]] = section
+    return file_diffs
+
+
+def _prefetch_local_diffs(relative_paths: list[str], base_branch: str, repo_root: Path) -> dict[str, str]:
+    """Fetch the diffs of several changed files with a single git process.
+
+    Local-mode counterpart of ``_prefetch_pr_diffs``: runs one ``git diff``
+    limited to *relative_paths* instead of one per changed file.  Other
+    changed files (possibly not UTF-8) are never part of the output.
+
+    Args:
+        relative_paths: File paths relative to the repository root.
+        base_branch: Base branch to diff against (merge-base with ``HEAD``).
+        repo_root: Repository root path.
+
+    Returns:
+        Mapping of relative file path to its unified diff content.  Empty if
+        ``git diff`` fails or its output is not UTF-8; missing files fall back
+        to a per-file lookup.
+    """
+    if not relative_paths:
+        return {}
+    try:
+        result = subprocess.run(
+            [
+                "git",
+                "diff",
+                "-U3",
+                "--no-renames",
+                "--no-color",
+                "--no-ext-diff",
+                "--relative",
+                "--src-prefix=a/",
+                "--dst-prefix=b/",
+                f"{base_branch}...HEAD",
+                "--",
+                *relative_paths,
+            ],
+            capture_output=True,
+            text=True,
+            cwd=repo_root,
+            timeout=30,
+        )
+    except (subprocess.SubprocessError, OSError, UnicodeDecodeError) as exc:  # fmt: skip
+        logger.warning(msg="Error running git diff for changed files", extra={"error": str(exc)})
+        return {}
+    if result.returncode != 0:
+        logger.warning(
+            msg="git diff failed for changed files",
+            extra={"returncode": result.returncode, "stderr": result.stderr.strip()},
+        )
+        return {}
+
+    file_diffs = _split_diff_by_file(diff_output=result.stdout)
+    logger.info(msg="Pre-fetched local file diffs", extra={"file_count": len(file_diffs)})
+    return file_diffs
+
+
 def _get_old_file_symbols(
     file_path: Path,
     base_branch: str,
     repo_root: Path,
     github_pr_info: dict[str, Any] | None,
+    base_sources_cache: dict[str, str | None] | None = None,
 ) -> tuple[set[str], dict[str, set[str]]] | None:
     """Fetch the base-branch version of a file and return its top-level symbol names.
 
@@ -1320,6 +1664,10 @@ def _get_old_file_symbols(
         repo_root: Repository root path.
         github_pr_info: Optional dict with ``repo``, ``pr_number``, and
             ``token`` keys for GitHub API access.
+        base_sources_cache: Optional pre-fetched mapping of relative file
+            paths to their base-branch source (``None`` for files missing
+            from the base branch), consulted before the GitHub Contents API
+            or ``git show``.
 
     Returns:
         Tuple of (symbol_names, class_members) where symbol_names is the set
@@ -1335,19 +1683,18 @@ def _get_old_file_symbols(
     except ValueError:
         relative_path = str(file_path)
 
-    if github_pr_info:
+    if base_sources_cache is not None and relative_path in base_sources_cache:
+        old_source = base_sources_cache[relative_path]
+        if old_source is None:
+            return set(), {}  # File is new (path not found in base branch)
+    elif github_pr_info:
         # Remote mode: use GitHub Contents API
         repo = github_pr_info["repo"]
         token = github_pr_info.get("token")
         encoded_path = urllib.parse.quote(string=relative_path, safe="/")
         url = f"https://api.github.com/repos/{repo}/contents/{encoded_path}?ref={base_branch}"
 
-        headers = {
-            "Accept": "application/vnd.github.v3+json",
-            "User-Agent": "pytest-marker-analyzer",
-        }
-        if token:
-            headers["Authorization"] = f"token {token}"
+        headers = _github_api_headers(token=token)
 
         request = urllib.request.Request(url, headers=headers)
         try:
@@ -1433,8 +1780,7 @@ def _get_old_file_symbols(
             class_members[node.name] = members
         elif isinstance(node, ast.Assign):
             for target in node.targets:
-                if isinstance(target, ast.Name):
-                    symbols.add(target.id)
+                symbols.update(_assignment_target_names(target=target))
         elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
             symbols.add(node.target.id)
 
@@ -1460,29 +1806,26 @@ def _parse_diff_for_changed_lines(diff_content: str) -> set[int]:
     current_line = 0
 
     for line in diff_content.splitlines():
-        if line.startswith("@@"):
-            match = re.search(pattern=r"\+(\d+)", string=line)
+        # Classify each line by its first character only
+        marker = line[:1]
+        if marker == "@" and line.startswith("@@"):
+            match = HUNK_NEW_START_PATTERN.search(string=line)
             if match:
                 current_line = int(match.group(1))
             continue
 
-        if line.startswith(("---", "+++")):
-            continue
-
         if current_line == 0:
             continue
 
-        if line.startswith("+"):
-            changed_lines.add(current_line)
-            current_line += 1
-        elif line.startswith("-"):
-            # Removed lines do not advance the new-file line counter
-            pass
-        elif line.startswith("\\"):
-            # "\ No newline at end of file" marker — not a real line
-            pass
-        else:
-            # Context line — advances new-file counter without marking
+        if marker == "+":
+            # "+++" is a file header, not an added line
+            if not line.startswith("+++"):
+                changed_lines.add(current_line)
+                current_line += 1
+        elif marker not in ("-", "\\"):
+            # Context line — advances new-file counter without marking.
+            # Removed lines ("-") and the "\ No newline at end of file"
+            # marker do not advance it.
             current_line += 1
 
     return changed_lines
@@ -1501,7 +1844,7 @@ def _diff_has_deletions(diff_content: str) -> bool:
     Returns:
         ``True`` if the diff contains at least one deletion line.
     """
-    return any(line.startswith("-") and not line.startswith("---") for line in diff_content.splitlines())
+    return DELETION_LINE_PATTERN.search(string=diff_content) is not None
 
 
 def _extract_deleted_symbols_from_diff(diff_content: str) -> set[str]:
@@ -1530,12 +1873,12 @@ def _extract_deleted_symbols_from_diff(diff_content: str) -> set[str]:
             continue
         stripped = line[1:].strip()
         # Match function definitions
-        func_match = re.match(pattern=r"(?:async\s+)?def\s+(\w+)\s*\(", string=stripped)
+        func_match = FUNCTION_DEF_PATTERN.match(string=stripped)
         if func_match:
             deleted_symbols.add(func_match.group(1))
             continue
         # Match class definitions
-        class_match = re.match(pattern=r"class\s+(\w+)[\s:(]", string=stripped)
+        class_match = CLASS_DEF_PATTERN.match(string=stripped)
         if class_match:
             deleted_symbols.add(class_match.group(1))
     return deleted_symbols
@@ -1615,7 +1958,8 @@ def _get_diff_content(
 def _fetch_pr_head_sha(github_pr_info: dict[str, Any]) -> str | None:
     """Fetch the HEAD commit SHA of a pull request.
 
-    # TODO: Consider extracting head SHA from existing PR info to avoid duplicate API call
+    Only used when the caller did not already supply ``head_sha`` from
+    :func:`get_pr_info`.
 
     Args:
         github_pr_info: Dict with repo, pr_number, and optional token.
@@ -1628,12 +1972,7 @@ def _fetch_pr_head_sha(github_pr_info: dict[str, Any]) -> str | None:
     pr_number = github_pr_info["pr_number"]
 
     pr_url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "pytest-marker-analyzer",
-    }
-    if token:
-        headers["Authorization"] = f"token {token}"
+    headers = _github_api_headers(token=token)
 
     try:
         request = urllib.request.Request(pr_url, headers=headers)
@@ -1675,12 +2014,7 @@ def _fetch_file_at_ref(
     encoded_path = urllib.parse.quote(string=relative_path, safe="/")
     url = f"https://api.github.com/repos/{repo}/contents/{encoded_path}?ref={ref}"
 
-    headers = {
-        "Accept": "application/vnd.github.v3+json",
-        "User-Agent": "pytest-marker-analyzer",
-    }
-    if token:
-        headers["Authorization"] = f"token {token}"
+    headers = _github_api_headers(token=token)
 
     try:
         request = urllib.request.Request(url, headers=headers)
@@ -1714,6 +2048,7 @@ def _extract_modified_symbols(
     file_status: str | None = None,
     pr_head_ref: str | None = None,
     is_checkout: bool = False,
+    base_sources_cache: dict[str, str | None] | None = None,
 ) -> SymbolClassification | None:
     """Determine which top-level symbols were modified or added in a file.
 
@@ -1740,6 +2075,9 @@ def _extract_modified_symbols(
             falling back to the local file after a fetch failure is safe.
             When ``False`` (remote analysis), the local file may be on a
             different branch and must not be used as fallback.
+        base_sources_cache: Optional pre-fetched mapping of relative file
+            paths to their base-branch source, used in local and checkout
+            modes to avoid one base-file lookup per file.
 
     Returns:
         ``SymbolClassification`` with modified and new symbol sets, or
@@ -1822,11 +2160,12 @@ def _extract_modified_symbols(
     modified_symbols: set[str] = set()
     for line_number in changed_lines:
         found = False
+        # No early exit: names unpacked from one assignment (``HOST, PORT = ...``)
+        # share a line range, and any of them may be the one that changed
         for start_line, end_line, symbol_name in symbol_map.top_level:
             if start_line <= line_number <= end_line:
                 modified_symbols.add(symbol_name)
                 found = True
-                break
         if not found:
             # Changed line is outside any top-level symbol.  Check whether
             # the line is "safe" (import, comment, blank, or string literal)
@@ -1852,7 +2191,7 @@ def _extract_modified_symbols(
                     "__all__",
                 )):
                     has_unattributed = True
-                elif re.match(pattern=r"^[A-Za-z_]\w*(?:\s+as\s+\w+)?\s*,\s*$", string=line_content):
+                elif IMPORT_CONTINUATION_PATTERN.match(string=line_content):
                     # Import continuation line (e.g. "TIMEOUT_2MIN," inside
                     # a multi-line "from ... import (...)" block).
                     # Trailing comma is required to avoid matching bare identifiers.
@@ -1927,8 +2266,7 @@ def _extract_modified_symbols(
     for start_line, end_line, symbol_name in symbol_map.top_level:
         if symbol_name not in modified_symbols:
             continue
-        all_lines_changed = all(line_num in changed_lines for line_num in range(start_line, end_line + 1))
-        if all_lines_changed:
+        if changed_lines.issuperset(range(start_line, end_line + 1)):
             candidate_new.add(symbol_name)
 
     if not candidate_new:
@@ -1959,6 +2297,7 @@ def _extract_modified_symbols(
         base_branch=base_branch,
         repo_root=repo_root,
         github_pr_info=github_pr_info,
+        base_sources_cache=base_sources_cache,
     )
     if old_result is None:
         # Error fetching old file — conservative: treat all candidates as modified
@@ -1971,11 +2310,7 @@ def _extract_modified_symbols(
 
     old_symbols, old_class_members = old_result
 
-    truly_new: set[str] = set()
-    for symbol_name in candidate_new:
-        if symbol_name not in old_symbols:
-            truly_new.add(symbol_name)
-
+    truly_new = candidate_new - old_symbols
     truly_modified = modified_symbols - truly_new
 
     # Enhance modified_members: exclude newly-added class members
@@ -1998,15 +2333,47 @@ def _extract_modified_symbols(
     )
 
 
-def _find_relevant_conftests_helper(test_file: Path, repo_root: Path) -> set[Path]:
+def _scan_python_files(directory: Path) -> list[Path]:
+    """Collect Python files under *directory* in a single scandir-based walk.
+
+    File types come from the cached directory entries, so no extra ``stat()``
+    is needed per entry.  Symlinked directories are not followed, matching
+    ``Path.rglob``; hidden directories and ``__pycache__`` are skipped, as
+    pytest does by default.
+
+    Args:
+        directory: Root directory to walk.
+
+    Returns:
+        Paths of all ``.py`` files found.
+    """
+    python_files: list[Path] = []
+    pending_dirs = [directory]
+    while pending_dirs:
+        with os.scandir(pending_dirs.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name != "__pycache__":
+                        pending_dirs.append(Path(entry.path))
+                elif entry.name.endswith(".py"):
+                    python_files.append(Path(entry.path))
+    return python_files
+
+
+@cache
+def _find_relevant_conftests_helper(test_file: Path, repo_root: Path) -> frozenset[Path]:
     """Find conftest.py files in the test's directory hierarchy.
 
+    Every marked test in a file walks the same directories, so results are
+    memoized per test file to avoid repeating the ``exists()`` lookups.
+
     Args:
         test_file: Test file path
         repo_root: Repository root path
 
     Returns:
-        Set of conftest.py file paths
+        Frozenset of conftest.py file paths.  The same object is shared by
+        every caller, so callers must not mutate it (copy it first if needed).
     """
     relevant = set()
     current = test_file.parent.resolve()
@@ -2025,13 +2392,14 @@ def _find_relevant_conftests_helper(test_file: Path, repo_root: Path) -> set[Pat
         if current == repo_root_resolved:
             break
 
-        # Safety check to prevent infinite loop
-        parent = current.parent.resolve()
+        # Safety check to prevent infinite loop.  The parent of a resolved
+        # path is already resolved, so no further resolve() is needed.
+        parent = current.parent
         if parent == current:  # Reached filesystem root
             break
         current = parent
 
-    return relevant
+    return frozenset(relevant)
 
 
 def _analyze_single_test_dependencies(
@@ -2059,15 +2427,13 @@ def _analyze_single_test_dependencies(
         # Add the test file itself as a dependency
         dependencies.add(marked_test.file_path)
 
-        # Extract direct imports from test file
-        imports = _extract_imports_from_file(file_path=marked_test.file_path)
-        dependencies.update(_resolve_imports_helper(imports=imports, repo_root=repo_root))
-
-        # Extract symbol-level imports for non-conftest dependencies
-        symbol_imports = _extract_symbol_imports_from_file(
+        # Extract direct imports and symbol-level imports (for non-conftest
+        # dependencies) from the test file in a single visitor pass
+        imports, symbol_imports = _extract_imports_with_symbols_from_file(
             file_path=marked_test.file_path,
             repo_root=repo_root,
         )
+        dependencies.update(_resolve_imports_helper(imports=imports, repo_root=repo_root))
 
         # Extract fixtures used by the test
         fixtures = _extract_fixtures_from_file(file_path=marked_test.file_path, marker_names=marker_names)
@@ -2178,6 +2544,8 @@ def _check_conftest_pathway(
     """
     matching_deps: list[str] = []
     conftest_resolved = False
+    # Report paths are used in every dependency description; compute them once
+    changed_file_rel = changed_file.relative_to(repo_root)
     used_fixtures = _expand_used_fixtures(direct_fixtures=marked_test.fixtures, fixtures_dict=fixtures_dict)
 
     for conftest_path in marked_test.dependencies:
@@ -2201,16 +2569,13 @@ def _check_conftest_pathway(
             if classification is not None and not classification.modified_symbols:
                 # Empty modified_symbols without new_symbols — could be pure deletion
                 # or unmapped module-level edits; fall back to conservative behavior
-                matching_deps.append(
-                    f"{changed_file.relative_to(repo_root)} (opaque import via {conftest_path.relative_to(repo_root)})"
-                )
+                matching_deps.append(f"{changed_file_rel} (opaque import via {conftest_path.relative_to(repo_root)})")
                 return True, matching_deps
             if classification is not None and classification.modified_symbols:
                 if classification.has_unattributed_changes:
                     # Module-level changes with opaque import — conservative fallback
                     matching_deps.append(
-                        f"{changed_file.relative_to(repo_root)} "
-                        f"(opaque import via {conftest_path.relative_to(repo_root)})"
+                        f"{changed_file_rel} (opaque import via {conftest_path.relative_to(repo_root)})"
                     )
                     return True, matching_deps
                 fixture_match = False
@@ -2218,12 +2583,10 @@ def _check_conftest_pathway(
                     if (
                         fixture.file_path == conftest_path
                         and fixture_name in used_fixtures
-                        and fixture.function_calls & classification.modified_symbols
+                        and (called_symbols := fixture.function_calls & classification.modified_symbols)
                     ):
-                        symbols_str = ", ".join(sorted(fixture.function_calls & classification.modified_symbols))
-                        matching_deps.append(
-                            f"{changed_file.relative_to(repo_root)} (via fixture {fixture_name}: {symbols_str})"
-                        )
+                        symbols_str = ", ".join(sorted(called_symbols))
+                        matching_deps.append(f"{changed_file_rel} (via fixture {fixture_name}: {symbols_str})")
                         fixture_match = True
                         break
                 if fixture_match:
@@ -2232,9 +2595,7 @@ def _check_conftest_pathway(
                 conftest_resolved = True
                 continue
             # classification is None — diff failed, fall back to file-level
-            matching_deps.append(
-                f"{changed_file.relative_to(repo_root)} (opaque import via {conftest_path.relative_to(repo_root)})"
-            )
+            matching_deps.append(f"{changed_file_rel} (opaque import via {conftest_path.relative_to(repo_root)})")
             return True, matching_deps
 
         # Check if conftest imports specific symbols from the changed file
@@ -2261,11 +2622,11 @@ def _check_conftest_pathway(
                     if (
                         fixture.file_path == conftest_path
                         and fixture_name in used_fixtures
-                        and fixture.function_calls & conftest_imported_from_intermediate
+                        and (called_symbols := fixture.function_calls & conftest_imported_from_intermediate)
                     ):
-                        symbols_str = ", ".join(sorted(fixture.function_calls & conftest_imported_from_intermediate))
+                        symbols_str = ", ".join(sorted(called_symbols))
                         matching_deps.append(
-                            f"{changed_file.relative_to(repo_root)} (via "
+                            f"{changed_file_rel} (via "
                             f"{intermediate_path.relative_to(repo_root)} -> fixture {fixture_name}: {symbols_str})"
                         )
                         fixture_match = True
@@ -2300,12 +2661,10 @@ def _check_conftest_pathway(
             if (
                 fixture.file_path == conftest_path
                 and fixture_name in used_fixtures
-                and fixture.function_calls & symbols_to_check
+                and (called_symbols := fixture.function_calls & symbols_to_check)
             ):
-                symbols_str = ", ".join(sorted(fixture.function_calls & symbols_to_check))
-                matching_deps.append(
-                    f"{changed_file.relative_to(repo_root)} (via fixture {fixture_name}: {symbols_str})"
-                )
+                symbols_str = ", ".join(sorted(called_symbols))
+                matching_deps.append(f"{changed_file_rel} (via fixture {fixture_name}: {symbols_str})")
                 fixture_match = True
                 break
 
@@ -2315,12 +2674,34 @@ def _check_conftest_pathway(
 
     if not conftest_resolved:
         # No conftest pathway found — file-level fallback (conservative)
-        matching_deps.append(str(changed_file.relative_to(repo_root)))
+        matching_deps.append(str(changed_file_rel))
         return True, matching_deps
 
     return bool(matching_deps), matching_deps
 
 
+def _get_file_status(file_path: Path, repo_root: Path, pr_file_statuses: dict[str, str] | None) -> str | None:
+    """Look up the GitHub PR file status of a changed file.
+
+    Args:
+        file_path: Absolute path to the changed file.
+        repo_root: Repository root path.
+        pr_file_statuses: Optional mapping of relative file paths to their
+            GitHub file status strings.
+
+    Returns:
+        File status (e.g. ``"added"``, ``"modified"``), or ``None`` when no
+        statuses are available or the file is not listed.
+    """
+    if not pr_file_statuses:
+        return None
+    try:
+        relative_path = str(file_path.relative_to(repo_root))
+    except ValueError:
+        relative_path = str(file_path)
+    return pr_file_statuses.get(relative_path)
+
+
 def _check_test_impact(
     node_id: str,
     marked_test: MarkedTest,
@@ -2336,6 +2717,7 @@ def _check_test_impact(
     pr_file_statuses: dict[str, str] | None = None,
     is_checkout: bool = False,
     pr_head_ref: str | None = None,
+    conftest_modified_items_cache: dict[Path, tuple[set[str] | None, set[str] | None]] | None = None,
 ) -> dict[str, Any] | None:
     """Check if a single test is affected by changed files (for parallel execution).
 
@@ -2371,6 +2753,11 @@ def _check_test_impact(
             GitHub file status strings.
         pr_head_ref: Optional PR head commit SHA used in remote (no-checkout)
             mode to fetch the correct version of files from GitHub.
+        conftest_modified_items_cache: Optional pre-computed mapping of
+            changed conftest paths to their ``(modified_fixtures,
+            modified_functions)`` as returned by
+            ``_extract_modified_items_from_conftest``.  Conftests missing
+            from the mapping are analyzed on demand.
 
     Returns:
         Dictionary with test info if affected, ``None`` otherwise.
@@ -2381,9 +2768,14 @@ def _check_test_impact(
         conftest_symbol_imports = {}
     if conftest_opaque_deps is None:
         conftest_opaque_deps = {}
+    if conftest_modified_items_cache is None:
+        conftest_modified_items_cache = {}
 
     test_affected = False
     matching_deps: list[str] = []
+    # Attribute accesses and calls in the test body, collected lazily on first
+    # use and shared by every changed dependency of this test
+    test_body_collections: dict[str, set[str] | None] = {}
 
     for changed_file in changed_set:
         # Self-modification check: test's own file is changed
@@ -2404,9 +2796,8 @@ def _check_test_impact(
                 test_symbols_to_check.add(method_name)
 
             # Check if any of the test's own symbols were modified
-            if test_symbols_to_check & classification.modified_symbols:
-                modified_test_syms = test_symbols_to_check & classification.modified_symbols
-
+            modified_test_syms = test_symbols_to_check & classification.modified_symbols
+            if modified_test_syms:
                 # For class-based tests, apply member-level narrowing
                 narrowed_away = True
                 for sym in modified_test_syms:
@@ -2436,25 +2827,21 @@ def _check_test_impact(
 
         # Special handling for conftest.py: use fixture-level analysis
         if changed_file.name == "conftest.py" and changed_file in marked_test.dependencies:
-            # Resolve file status for the conftest file
-            file_status_conftest: str | None = None
-            if pr_file_statuses:
-                try:
-                    rel = str(changed_file.relative_to(repo_root))
-                except ValueError:
-                    rel = str(changed_file)
-                file_status_conftest = pr_file_statuses.get(rel)
-
-            modified_fixtures, modified_functions = _extract_modified_items_from_conftest(
-                changed_file=changed_file,
-                base_branch=base_branch,
-                repo_root=repo_root,
-                github_pr_info=github_pr_info,
-                pr_diffs_cache=pr_diffs_cache,
-                file_status=file_status_conftest,
-                is_checkout=is_checkout,
-                pr_head_ref=pr_head_ref,
-            )
+            if changed_file in conftest_modified_items_cache:
+                modified_fixtures, modified_functions = conftest_modified_items_cache[changed_file]
+            else:
+                modified_fixtures, modified_functions = _extract_modified_items_from_conftest(
+                    changed_file=changed_file,
+                    base_branch=base_branch,
+                    repo_root=repo_root,
+                    github_pr_info=github_pr_info,
+                    pr_diffs_cache=pr_diffs_cache,
+                    file_status=_get_file_status(
+                        file_path=changed_file, repo_root=repo_root, pr_file_statuses=pr_file_statuses
+                    ),
+                    is_checkout=is_checkout,
+                    pr_head_ref=pr_head_ref,
+                )
 
             # None signals structural change (e.g., pytest_plugins modified)
             # — flag test unconditionally since fixture loading may change
@@ -2492,10 +2879,12 @@ def _check_test_impact(
 
                     # --- Member-level narrowing ---
                     if common_symbols and classification.modified_members:
-                        test_attrs = _collect_test_attribute_accesses(
-                            test_file=marked_test.file_path,
-                            test_name=marked_test.test_name,
-                        )
+                        if "attrs" not in test_body_collections:
+                            test_body_collections["attrs"] = _collect_test_attribute_accesses(
+                                test_file=marked_test.file_path,
+                                test_name=marked_test.test_name,
+                            )
+                        test_attrs = test_body_collections["attrs"]
                         narrowed_symbols: set[str] = set()
                         for sym in common_symbols:
                             if sym not in classification.modified_members:
@@ -2512,10 +2901,12 @@ def _check_test_impact(
                     # Check if the test actually calls the modified top-level
                     # functions (not just file-level imports shared with siblings)
                     if common_symbols:
-                        test_calls = _collect_test_function_calls(
-                            test_file=marked_test.file_path,
-                            test_name=marked_test.test_name,
-                        )
+                        if "calls" not in test_body_collections:
+                            test_body_collections["calls"] = _collect_test_function_calls(
+                                test_file=marked_test.file_path,
+                                test_name=marked_test.test_name,
+                            )
+                        test_calls = test_body_collections["calls"]
                         if test_calls is not None:
                             narrowed_func_symbols: set[str] = set()
                             for sym in common_symbols:
@@ -2584,27 +2975,25 @@ def _get_affected_fixtures_helper(
         Set of all fixture names that are affected
     """
     affected = modified_fixtures.copy()
-    to_check = list(modified_fixtures)
 
-    # Also check fixtures that call modified functions
+    # Reverse dependency index (fixture -> fixtures that request it), so the
+    # closure below does not rescan every fixture for each affected one
+    dependents: dict[str, set[str]] = {}
     for fixture_name, fixture in fixtures_dict.items():
+        # Also check fixtures that call modified functions
         if fixture.function_calls & modified_functions:
             affected.add(fixture_name)
-            to_check.append(fixture_name)
+        for dependency_name in fixture.fixture_deps:
+            dependents.setdefault(dependency_name, set()).add(fixture_name)
 
     # Transitive closure
-    visited = set()
+    to_check = list(affected)
     while to_check:
         fixture_name = to_check.pop()
-        if fixture_name in visited:
-            continue
-        visited.add(fixture_name)
-
-        # Find fixtures that depend on this one
-        for other_name, other_fixture in fixtures_dict.items():
-            if fixture_name in other_fixture.fixture_deps and other_name not in affected:
-                affected.add(other_name)
-                to_check.append(other_name)
+        for dependent_name in dependents.get(fixture_name, set()):
+            if dependent_name not in affected:
+                affected.add(dependent_name)
+                to_check.append(dependent_name)
 
     return affected
 
@@ -2618,6 +3007,7 @@ def _extract_modified_items_from_conftest(
     file_status: str | None = None,
     is_checkout: bool = False,
     pr_head_ref: str | None = None,
+    base_sources_cache: dict[str, str | None] | None = None,
 ) -> tuple[set[str] | None, set[str] | None]:
     """Extract modified fixtures and functions from conftest.py.
 
@@ -2636,6 +3026,9 @@ def _extract_modified_items_from_conftest(
             (``"added"``, ``"modified"``, ``"removed"``, ``"renamed"``).
         pr_head_ref: Optional PR head commit SHA used in remote (no-checkout)
             mode to fetch the correct version of files from GitHub.
+        base_sources_cache: Optional pre-fetched mapping of relative file
+            paths to their base-branch source, used in local and checkout
+            modes instead of a per-file base-file lookup.
 
     Returns:
         Tuple of (modified_fixtures, modified_functions) containing only
@@ -2651,8 +3044,7 @@ def _extract_modified_items_from_conftest(
         # Get all fixtures in the file
         all_fixtures: set[str] = set()
         try:
-            source = changed_file.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(changed_file))
+            tree = _parse_python_file(file_path=changed_file)
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.FunctionDef):
@@ -2691,6 +3083,7 @@ def _extract_modified_items_from_conftest(
             file_status=file_status,
             is_checkout=is_checkout,
             pr_head_ref=pr_head_ref,
+            base_sources_cache=base_sources_cache,
         )
         if classification is None or "pytest_plugins" in (classification.modified_symbols | classification.new_symbols):
             # pytest_plugins controls plugin/fixture loading — signal to caller
@@ -2710,6 +3103,7 @@ def _extract_modified_items_from_conftest(
                 base_branch=base_branch,
                 repo_root=repo_root,
                 github_pr_info=github_pr_info,
+                base_sources_cache=base_sources_cache,
             )
             if old_result is not None:
                 old_symbols, _ = old_result
@@ -2814,7 +3208,7 @@ def _parse_diff_for_functions(diff_content: str) -> set[str]:
             if current_function and (has_changes_in_function or pending_decorator_change):
                 modified.add(current_function)
 
-            match = re.search(pattern=r"@@.*@@\s*(?:async\s+)?def\s+(\w+)", string=line)
+            match = HUNK_FUNCTION_CONTEXT_PATTERN.search(string=line)
             if match:
                 current_function = match.group(1)
                 has_changes_in_function = False
@@ -2828,7 +3222,7 @@ def _parse_diff_for_functions(diff_content: str) -> set[str]:
             stripped = line[1:].strip()
             if stripped and not stripped.startswith("#"):
                 # Check if this line defines a new function — reset tracking
-                func_match = re.match(pattern=r"(?:async\s+)?def\s+(\w+)\s*\(", string=stripped)
+                func_match = FUNCTION_DEF_PATTERN.match(string=stripped)
                 if func_match:
                     # Save previous function if it had real (non-decorator) changes
                     if current_function and has_changes_in_function:
@@ -2851,7 +3245,7 @@ def _parse_diff_for_functions(diff_content: str) -> set[str]:
             # Context line (unchanged) following a decorator change —
             # bind pending decorator to the function on this context line
             context_stripped = line[1:].strip()
-            context_func = re.match(pattern=r"(?:async\s+)?def\s+(\w+)\s*\(", string=context_stripped)
+            context_func = FUNCTION_DEF_PATTERN.match(string=context_stripped)
             if context_func:
                 if current_function and has_changes_in_function:
                     modified.add(current_function)
@@ -2957,19 +3351,19 @@ def _find_test_function_node(
     Returns:
         The function/async function AST node, or None if not found.
     """
-    parent_map: dict[ast.AST, ast.AST] = {}
-    for parent in ast.walk(tree):
-        for child in ast.iter_child_nodes(parent):
-            parent_map[child] = parent
+    if class_name_prefix is None:
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == actual_test_name:
+                return node
+        return None
 
+    # Methods are direct children of their class, so only class bodies need to be
+    # scanned instead of mapping every node in the module to its parent.
     for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == actual_test_name:
-            if class_name_prefix is not None:
-                parent = parent_map.get(node)
-                if isinstance(parent, ast.ClassDef) and parent.name == class_name_prefix:
-                    return node
-            else:
-                return node
+        if isinstance(node, ast.ClassDef) and node.name == class_name_prefix:
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name == actual_test_name:
+                    return item
     return None
 
 
@@ -2989,8 +3383,7 @@ def _collect_test_attribute_accesses(
         name appears as a constructor call.
     """
     try:
-        source = test_file.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(test_file))
+        tree = _parse_python_file(file_path=test_file)
     except (SyntaxError, UnicodeDecodeError, OSError):  # fmt: skip
         return None
 
@@ -3039,8 +3432,7 @@ def _collect_test_function_calls(
         cannot be found (conservative fallback).
     """
     try:
-        source = test_file.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(test_file))
+        tree = _parse_python_file(file_path=test_file)
     except (SyntaxError, UnicodeDecodeError, OSError):  # fmt: skip
         return None
 
@@ -3084,6 +3476,7 @@ class MarkerTestAnalyzer:
         self.conftest_opaque_deps: dict[Path, set[Path]] = {}
         # conftest_path -> {file_paths imported opaquely (bare import / star import)}
         self.fixture_usage: dict[str, set[str]] = {}  # test_node_id -> set of fixture names
+        self._missing_pytest_launchers: set[tuple[str, ...]] = set()
         self.infrastructure_dirs = {
             self.repo_root / "utilities",
             self.repo_root / "libs",
@@ -3096,6 +3489,8 @@ class MarkerTestAnalyzer:
         1. Direct 'pytest' (if in venv or system PATH)
         2. 'uv run pytest' (if uv is available)
 
+        A launcher that is not installed is skipped on later calls.
+
         Returns:
             CompletedProcess if successful, None if all attempts failed
         """
@@ -3105,7 +3500,7 @@ class MarkerTestAnalyzer:
                 logger.error(msg="Invalid argument type", extra={"arg_type": str(type(arg))})
                 return None
             # Reject shell metacharacters that could enable command injection
-            if any(char in arg for char in [";", "|", "&", "`", "$", "\n", "\r"]):
+            if not PYTEST_ARG_FORBIDDEN_CHARS.isdisjoint(arg):
                 logger.warning(msg="Suspicious argument rejected", extra={"arg": arg})
                 return None
 
@@ -3120,52 +3515,36 @@ class MarkerTestAnalyzer:
 
         logger.info(msg="Executing pytest command", extra={"cmd_args": " ".join(args)})
 
-        # Try direct pytest first (works in containers with venv)
-        try:
-            result = subprocess.run(
-                ["pytest"] + args,
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                timeout=PYTEST_COLLECTION_TIMEOUT_SECONDS,
-                env=env,
-            )
+        # Try direct pytest first (works in containers with venv), then uv.
+        # Launchers found missing are remembered so later calls skip them.
+        for launcher in PYTEST_LAUNCHERS:
+            if launcher in self._missing_pytest_launchers:
+                continue
+            command = [*launcher, *args]
+            try:
+                result = subprocess.run(
+                    command,
+                    cwd=self.repo_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=PYTEST_COLLECTION_TIMEOUT_SECONDS,
+                    env=env,
+                )
+            except FileNotFoundError:
+                logger.info(msg="pytest launcher not found", extra={"launcher": " ".join(launcher)})
+                self._missing_pytest_launchers.add(launcher)
+                continue
+            except subprocess.TimeoutExpired:
+                logger.warning(
+                    msg="Command timed out",
+                    extra={"timeout_seconds": PYTEST_COLLECTION_TIMEOUT_SECONDS, "command": " ".join(command)},
+                )
+                return None
             # If pytest ran (even with errors), return the result
             logger.info(msg="pytest completed", extra={"exit_code": result.returncode})
             return result
-        except FileNotFoundError:
-            logger.info(msg="Direct 'pytest' not found, trying 'uv run pytest'")
-        except subprocess.TimeoutExpired:
-            logger.warning(
-                msg="Command timed out",
-                extra={"timeout_seconds": PYTEST_COLLECTION_TIMEOUT_SECONDS, "command": f"pytest {' '.join(args)}"},
-            )
-            return None
 
-        # Try uv run pytest as fallback
-        try:
-            result = subprocess.run(
-                ["uv", "run", "pytest"] + args,
-                cwd=self.repo_root,
-                capture_output=True,
-                text=True,
-                timeout=PYTEST_COLLECTION_TIMEOUT_SECONDS,
-                env=env,
-            )
-            logger.info(msg="pytest completed", extra={"exit_code": result.returncode})
-            return result
-        except FileNotFoundError:
-            logger.info(msg="'uv run pytest' not found")
-            return None
-        except subprocess.TimeoutExpired:
-            logger.warning(
-                msg="Command timed out",
-                extra={
-                    "timeout_seconds": PYTEST_COLLECTION_TIMEOUT_SECONDS,
-                    "command": f"uv run pytest {' '.join(args)}",
-                },
-            )
-            return None
+        return None
 
     def discover_marked_tests(self) -> None:
         """Discover all tests with specified marker expression using pytest collection."""
@@ -3249,7 +3628,7 @@ class MarkerTestAnalyzer:
 
             # Fixture setup line (SETUP F fixture_name) - collect before test
             if line.startswith("SETUP"):
-                match = re.search(pattern=r"SETUP\s+[FSM]\s+(\w+)", string=line)
+                match = SETUP_PLAN_FIXTURE_PATTERN.search(string=line)
                 if match:
                     fixture_name = match.group(1)
                     current_fixtures.add(fixture_name)
@@ -3257,7 +3636,7 @@ class MarkerTestAnalyzer:
             # WARNING lines from pytest-dependency (tests with @pytest.mark.dependency)
             elif line.startswith("WARNING:") and "::" in line:
                 # Extract test ID from "WARNING: cannot execute test relative to others: tests/..."
-                match = re.search(pattern=r":\s+(tests/[^\s]+::[^\s]+)", string=line)
+                match = SETUP_PLAN_TEST_ID_PATTERN.search(string=line)
                 if match:
                     node_id = match.group(1)
                     # Only add fixture info if test was already discovered
@@ -3291,14 +3670,12 @@ class MarkerTestAnalyzer:
             logger.warning(msg="Tests directory not found", extra={"tests_dir": str(tests_dir)})
             return
 
-        # Collect all test files to process
-        test_files = []
-        # Scan test_*.py pattern
-        test_files.extend(tests_dir.rglob("test_*.py"))
-        # Also scan *_test.py pattern
-        test_files.extend(tests_dir.rglob("*_test.py"))
-        # Remove duplicates
-        test_files = list(set(test_files))
+        # Collect test_*.py and *_test.py files in a single directory walk
+        test_files = [
+            file_path
+            for file_path in _scan_python_files(directory=tests_dir)
+            if TEST_FILE_NAME_PATTERN.fullmatch(file_path.name)
+        ]
 
         logger.info(msg="Found test files to scan", extra={"file_count": len(test_files)})
 
@@ -3345,8 +3722,7 @@ class MarkerTestAnalyzer:
         """
         tests = []
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = _parse_python_file(file_path=file_path)
 
             # STEP 1: Check for module-level pytestmark assignment
             # If found, ALL test functions/methods in the file should be included
@@ -3470,30 +3846,11 @@ class MarkerTestAnalyzer:
         Returns:
             Set of all fixture names that are affected (directly or transitively)
         """
-        affected = modified_fixtures.copy()
-        to_check = list(modified_fixtures)
-
-        # Also check fixtures that call modified functions
-        for fixture_name, fixture in self.fixtures.items():
-            if fixture.function_calls & modified_functions:
-                affected.add(fixture_name)
-                to_check.append(fixture_name)
-
-        # Transitive closure: find all fixtures that depend on affected fixtures
-        visited = set()
-        while to_check:
-            fixture_name = to_check.pop()
-            if fixture_name in visited:
-                continue
-            visited.add(fixture_name)
-
-            # Find fixtures that depend on this one
-            for other_name, other_fixture in self.fixtures.items():
-                if fixture_name in other_fixture.fixture_deps and other_name not in affected:
-                    affected.add(other_name)
-                    to_check.append(other_name)
-
-        return affected
+        return _get_affected_fixtures_helper(
+            modified_fixtures=modified_fixtures,
+            modified_functions=modified_functions,
+            fixtures_dict=self.fixtures,
+        )
 
     def analyze_dependencies(self) -> None:
         """Analyze dependencies for all marked tests (parallelized)."""
@@ -3554,7 +3911,9 @@ class MarkerTestAnalyzer:
         """Find all conftest.py files in the repository."""
         tests_dir = self.repo_root / "tests"
         if tests_dir.exists():
-            self.conftest_files = list(tests_dir.rglob("conftest.py"))
+            self.conftest_files = [
+                file_path for file_path in _scan_python_files(directory=tests_dir) if file_path.name == "conftest.py"
+            ]
         root_conftest = self.repo_root / "conftest.py"
         if root_conftest.exists():
             self.conftest_files.append(root_conftest)
@@ -3565,6 +3924,7 @@ class MarkerTestAnalyzer:
         if files:
             # Use provided files with validation
             validated_files = []
+            repo_root_resolved = self.repo_root.resolve()
             for file_path_str in files:
                 file_path = Path(file_path_str)
                 # Security: Skip symlinks to prevent path traversal attacks
@@ -3577,33 +3937,41 @@ class MarkerTestAnalyzer:
                     continue
                 # Verify it's within repo
                 try:
-                    file_path.relative_to(other=self.repo_root.resolve())
+                    file_path.relative_to(other=repo_root_resolved)
                     validated_files.append(file_path)
                 except ValueError:
                     logger.warning(msg="File is outside repository", extra={"file": file_path_str})
             return validated_files
 
         # Validate branch name (alphanumeric, dash, underscore, slash, dot)
-        if not re.match(pattern=r"^[a-zA-Z0-9/_.-]+$", string=base_branch):
+        if not BRANCH_NAME_PATTERN.fullmatch(string=base_branch):
             logger.error(msg="Invalid branch name", extra={"branch": base_branch})
             return []
 
-        # Get changed files from git
+        # Get changed files from git.  Rename detection is skipped: a rename is
+        # listed as delete + add, matching the per-file diffs, and git does not
+        # have to score file similarity.  ``-z`` emits raw NUL-terminated paths,
+        # so names with spaces or non-ASCII characters are not quoted.
         try:
             result = subprocess.run(
-                ["git", "diff", "--name-only", f"{base_branch}...HEAD"],
+                ["git", "diff", "--name-only", "--no-renames", "-z", f"{base_branch}...HEAD"],
                 cwd=self.repo_root,
                 capture_output=True,
                 text=True,
-                check=True,
             )
-            changed = [self.repo_root / line.strip() for line in result.stdout.splitlines() if line.strip()]
-            logger.info(msg="Found changed files from git", extra={"file_count": len(changed)})
-            return changed
-
-        except subprocess.CalledProcessError as e:
+        except (subprocess.SubprocessError, OSError) as e:
             logger.error(msg="Failed to get changed files from git", extra={"error": str(e)})
             return []
+        if result.returncode != 0:
+            logger.error(
+                msg="Failed to get changed files from git",
+                extra={"returncode": result.returncode, "stderr": result.stderr.strip()},
+            )
+            return []
+
+        changed = [self.repo_root / path for path in result.stdout.split("\0") if path]
+        logger.info(msg="Found changed files from git", extra={"file_count": len(changed)})
+        return changed
 
     def analyze_impact(self, changed_files: list[Path]) -> AnalysisResult:
         """Analyze if changed files impact marked tests (parallelized).
@@ -3615,7 +3983,17 @@ class MarkerTestAnalyzer:
 
         New symbols (functions, constants, fixtures) added by the PR are
         excluded from impact analysis since they cannot break existing tests.
+
+        Parsed modules cached during the run are released once the analysis
+        finishes, so repeated runs in one process do not accumulate them.
         """
+        try:
+            return self._analyze_impact(changed_files=changed_files)
+        finally:
+            _clear_ast_cache()
+
+    def _analyze_impact(self, changed_files: list[Path]) -> AnalysisResult:
+        """Run the impact analysis for ``analyze_impact``."""
         affected_tests: list[dict[str, Any]] = []
         should_run = False
         reasons: list[str] = []
@@ -3623,6 +4001,27 @@ class MarkerTestAnalyzer:
         # Convert changed files to set for faster lookup
         changed_set = {f.resolve() for f in changed_files}
 
+        # Only files that some marked test depends on (or is defined in) can
+        # affect a test; all other changed files are never looked up
+        relevant_files: set[Path] = set()
+        for marked_test in self.marked_tests.values():
+            relevant_files.update(marked_test.dependencies)
+            relevant_files.add(marked_test.file_path)
+        relevant_changed_files = changed_set & relevant_files
+
+        if not relevant_changed_files:
+            # Nothing to diff — skip fetching diffs, statuses and the PR head
+            return AnalysisResult(
+                should_run_tests=False,
+                reason="No changes affect test dependencies",
+                marker_expression=self.marker_expression,
+                affected_tests=[],
+                changed_files=[str(cf.relative_to(self.repo_root)) for cf in changed_files],
+                total_tests=len(self.marked_tests),
+            )
+
+        changed_python_files = [changed_file for changed_file in relevant_changed_files if changed_file.suffix == ".py"]
+
         # Pre-fetch all PR file diffs and file statuses in a single API pass
         # to avoid N separate paginated API calls (O(N^2) -> O(N)).
         pr_diffs_cache: dict[str, str] | None = None
@@ -3633,36 +4032,114 @@ class MarkerTestAnalyzer:
                 pr_number=self.github_pr_info["pr_number"],
                 token=self.github_pr_info.get("token"),
             )
+        else:
+            # Same for local mode: one git diff for the changed Python files
+            # instead of one per file
+            pr_diffs_cache = _prefetch_local_diffs(
+                relative_paths=[str(changed_file.relative_to(self.repo_root)) for changed_file in changed_python_files],
+                base_branch=self.base_branch,
+                repo_root=self.repo_root,
+            )
 
-        # Fetch PR head SHA once for remote mode symbol map alignment
+        # Resolve PR head SHA once for remote mode symbol map alignment,
+        # reusing the SHA from the PR info request when available.  In
+        # checkout mode the working tree already is the PR head, so head-side
+        # sources are read from disk instead of one Contents API call per file.
         pr_head_ref: str | None = None
-        if self.github_pr_info:
-            pr_head_ref = _fetch_pr_head_sha(github_pr_info=self.github_pr_info)
+        if self.github_pr_info and not self.is_checkout:
+            pr_head_ref = self.github_pr_info.get("head_sha") or _fetch_pr_head_sha(github_pr_info=self.github_pr_info)
+
+        symbol_files = [changed_file for changed_file in changed_python_files if changed_file.name != "conftest.py"]
+
+        # Local and checkout modes: read base-branch versions of all candidate
+        # files, conftests included, in one git process instead of one
+        # "git show" or GitHub Contents API request per file
+        base_sources_cache: dict[str, str | None] | None = None
+        if (not self.github_pr_info or self.is_checkout) and changed_python_files:
+            base_sources_cache = _prefetch_base_sources(
+                relative_paths=[str(changed_file.relative_to(self.repo_root)) for changed_file in changed_python_files],
+                base_branch=self.base_branch,
+                repo_root=self.repo_root,
+            )
+            # Files identical to the base branch did not change in effect.  Drop
+            # them from every pathway (direct imports, conftests, test files)
+            # so they are never classified or treated as possible deletions.
+            base_identical_files = _base_identical_files(
+                candidate_files=changed_python_files, base_sources_cache=base_sources_cache, repo_root=self.repo_root
+            )
+            if base_identical_files:
+                changed_set -= base_identical_files
+                changed_python_files = [
+                    changed_file for changed_file in changed_python_files if changed_file not in base_identical_files
+                ]
+                symbol_files = [
+                    changed_file for changed_file in symbol_files if changed_file not in base_identical_files
+                ]
 
         # Pre-compute modified symbols for each changed non-conftest Python file.
         # This cache is shared across all test impact checks to avoid redundant
-        # diff parsing and AST analysis.
+        # diff parsing and AST analysis.  Files are independent of each other, so
+        # they are classified in parallel (I/O-bound: git/GitHub diff and file fetches).
         modified_symbols_cache: dict[Path, SymbolClassification | None] = {}
-        for changed_file in changed_set:
-            if changed_file.suffix == ".py" and changed_file.name != "conftest.py":
-                file_status: str | None = None
-                if pr_file_statuses:
-                    try:
-                        rel = str(changed_file.relative_to(self.repo_root))
-                    except ValueError:
-                        rel = str(changed_file)
-                    file_status = pr_file_statuses.get(rel)
-
-                modified_symbols_cache[changed_file] = _extract_modified_symbols(
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            future_to_file: dict[Future[SymbolClassification | None], Path] = {}
+            for changed_file in symbol_files:
+                future = executor.submit(
+                    _extract_modified_symbols,
                     file_path=changed_file,
                     base_branch=self.base_branch,
                     repo_root=self.repo_root,
                     github_pr_info=self.github_pr_info,
                     pr_diffs_cache=pr_diffs_cache,
-                    file_status=file_status,
+                    file_status=_get_file_status(
+                        file_path=changed_file, repo_root=self.repo_root, pr_file_statuses=pr_file_statuses
+                    ),
                     pr_head_ref=pr_head_ref,
                     is_checkout=self.is_checkout,
+                    base_sources_cache=base_sources_cache,
                 )
+                future_to_file[future] = changed_file
+
+            for future in as_completed(future_to_file):
+                changed_file = future_to_file[future]
+                try:
+                    modified_symbols_cache[changed_file] = future.result()
+                except (SyntaxError, UnicodeDecodeError, OSError, subprocess.SubprocessError) as exc:  # fmt: skip
+                    # Unknown changes — fall back to file-level tracking for this file
+                    logger.info(
+                        msg="Error extracting modified symbols",
+                        extra={"file": str(changed_file), "error": str(exc)},
+                    )
+                    modified_symbols_cache[changed_file] = None
+
+        # Pre-compute modified fixtures/functions once per changed conftest that
+        # marked tests depend on, instead of re-diffing it for every such test.
+        # Conftests are independent of each other, so they are analyzed in parallel
+        # (I/O-bound: git/GitHub diff and file fetches).
+        conftest_modified_items_cache: dict[Path, tuple[set[str] | None, set[str] | None]] = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            future_to_conftest = {
+                executor.submit(
+                    _extract_modified_items_from_conftest,
+                    changed_file=changed_file,
+                    base_branch=self.base_branch,
+                    repo_root=self.repo_root,
+                    github_pr_info=self.github_pr_info,
+                    pr_diffs_cache=pr_diffs_cache,
+                    file_status=_get_file_status(
+                        file_path=changed_file, repo_root=self.repo_root, pr_file_statuses=pr_file_statuses
+                    ),
+                    is_checkout=self.is_checkout,
+                    pr_head_ref=pr_head_ref,
+                    base_sources_cache=base_sources_cache,
+                ): changed_file
+                for changed_file in changed_python_files
+                if changed_file.name == "conftest.py"
+            }
+
+            # _extract_modified_items_from_conftest handles its own errors
+            for future in as_completed(future_to_conftest):
+                conftest_modified_items_cache[future_to_conftest[future]] = future.result()
 
         # Check each marked test for dependency matches in parallel using ThreadPoolExecutor
         # (I/O-bound: git operations and file reading)
@@ -3685,6 +4162,7 @@ class MarkerTestAnalyzer:
                     pr_file_statuses=pr_file_statuses,
                     is_checkout=self.is_checkout,
                     pr_head_ref=pr_head_ref,
+                    conftest_modified_items_cache=conftest_modified_items_cache,
                 ): node_id
                 for node_id, marked_test in self.marked_tests.items()
             }
@@ -3723,26 +4201,32 @@ class MarkerTestAnalyzer:
 
 def format_markdown_output(result: AnalysisResult) -> str:
     """Format analysis result as Markdown."""
-    output = ["## Test Execution Plan", ""]
-    output.append(f"**Run tests with marker expression `{result.marker_expression}`: {result.should_run_tests}**")
-    output.append("")
-    output.append(f"**Reason:** {result.reason}")
-    output.append("")
+    output = [
+        "## Test Execution Plan",
+        "",
+        f"**Run tests with marker expression `{result.marker_expression}`: {result.should_run_tests}**",
+        "",
+        f"**Reason:** {result.reason}",
+        "",
+    ]
 
     if result.affected_tests:
         output.append(f"### Affected tests with marker expression `{result.marker_expression}`:")
         for test in result.affected_tests:
-            output.append(f"- `{test['node_id']}`")
-            output.append(f"  - Test file: `{test['test_file']}`")
-            output.append(f"  - Dependencies affected: {len(test['dependencies'])}")
-            for dep in test["dependencies"][:3]:  # Show first 3 dependencies
-                output.append(f"    - `{dep}`")
+            output.extend([
+                f"- `{test['node_id']}`",
+                f"  - Test file: `{test['test_file']}`",
+                f"  - Dependencies affected: {len(test['dependencies'])}",
+            ])
+            output.extend(f"    - `{dep}`" for dep in test["dependencies"][:3])  # Show first 3 dependencies
             if len(test["dependencies"]) > 3:
                 output.append(f"    - ... and {len(test['dependencies']) - 3} more")
         output.append("")
 
-    output.append(f"**Total tests with marker expression `{result.marker_expression}`:** {result.total_tests}")
-    output.append(f"**Changed files:** {len(result.changed_files)}")
+    output.extend([
+        f"**Total tests with marker expression `{result.marker_expression}`:** {result.total_tests}",
+        f"**Changed files:** {len(result.changed_files)}",
+    ])
 
     return "\n".join(output)
 
@@ -3938,17 +4422,15 @@ def run_github_mode(args: argparse.Namespace) -> tuple[AnalysisResult | None, in
 
             # Fetch the base branch for comparison
             logger.info(msg="Fetching base branch", extra={"base_branch": base_branch})
-            try:
-                subprocess.run(
-                    ["git", "-C", str(workdir), "fetch", "origin", f"{base_branch}:{base_branch}"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    timeout=60,
-                )
-            except subprocess.CalledProcessError as e:
+            fetch_result = subprocess.run(
+                ["git", "-C", str(workdir), "fetch", "origin", f"{base_branch}:{base_branch}"],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            if fetch_result.returncode != 0:
                 logger.warning(
-                    msg="Failed to fetch base branch", extra={"base_branch": base_branch, "stderr": e.stderr}
+                    msg="Failed to fetch base branch", extra={"base_branch": base_branch, "stderr": fetch_result.stderr}
                 )
                 # Continue anyway - the branch might already be available
 
@@ -3967,6 +4449,7 @@ def run_github_mode(args: argparse.Namespace) -> tuple[AnalysisResult | None, in
                 "repo": args.repo,
                 "pr_number": args.pr,
                 "token": token,
+                "head_sha": pr_info["head_sha"],
             }
 
         changed_files_list = [repo_root / fname for fname in changed_file_names]
@@ -3984,7 +4467,11 @@ def run_github_mode(args: argparse.Namespace) -> tuple[AnalysisResult | None, in
             logger.error(msg="No tests found with marker expression", extra={"marker_expression": args.markers})
             return None, 1
 
-        analyzer.analyze_dependencies()
+        if any(changed_file.suffix == ".py" for changed_file in changed_files_list):
+            analyzer.analyze_dependencies()
+        else:
+            # Marked tests only depend on Python files, so nothing else can affect them
+            logger.info(msg="No Python files changed, skipping dependency analysis")
         result = analyzer.analyze_impact(changed_files=changed_files_list)
         return result, 0
 
@@ -4009,12 +4496,17 @@ def run_local_mode(args: argparse.Namespace) -> tuple[AnalysisResult | None, int
         logger.error(msg="No tests found with marker expression", extra={"marker_expression": args.markers})
         return None, 1
 
-    analyzer.analyze_dependencies()
     changed_files = analyzer.get_changed_files(base_branch=args.base, files=args.files)  # keyword args used
 
     if not changed_files:
         logger.warning(msg="No changed files found")
 
+    if any(changed_file.suffix == ".py" for changed_file in changed_files):
+        analyzer.analyze_dependencies()
+    else:
+        # Marked tests only depend on Python files, so nothing else can affect them
+        logger.info(msg="No Python files changed, skipping dependency analysis")
+
     result = analyzer.analyze_impact(changed_files=changed_files)
     return result, 0
 
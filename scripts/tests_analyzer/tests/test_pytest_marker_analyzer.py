@@ -6,16 +6,22 @@ Co-authored-by: Claude <noreply@anthropic.com>
 
 import argparse
 import ast
+import subprocess
 import textwrap
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from scripts.tests_analyzer.pytest_marker_analyzer import (
+    _AST_CACHE,
     AttributeAccessCollector,
     Fixture,
     ImportVisitor,
     MarkedTest,
+    MarkerTestAnalyzer,
     SymbolClassification,
+    _base_identical_files,
     _build_intra_class_call_graph,
     _build_line_to_symbol_map,
     _check_conftest_pathway,
@@ -25,10 +31,21 @@ from scripts.tests_analyzer.pytest_marker_analyzer import (
     _extract_deleted_symbols_from_diff,
     _extract_modified_items_from_conftest,
     _extract_modified_symbols,
+    _find_relevant_conftests_helper,
+    _get_affected_fixtures_helper,
     _get_modified_function_names,
+    _get_old_file_symbols,
     _is_fixture_decorator_standalone,
+    _parse_diff_for_changed_lines,
     _parse_diff_for_functions,
+    _parse_python_file,
+    _prefetch_base_sources,
+    _prefetch_local_diffs,
+    _scan_python_files,
+    _split_diff_by_file,
     run_github_mode,
+    run_local_mode,
+    validate_repo_name,
 )
 
 
@@ -102,6 +119,12 @@ class TestBuildLineToSymbolMap:
         names = [entry[2] for entry in symbol_map.top_level]
         assert "FOO" in names
 
+    def test_tuple_unpacking_assignment(self):
+        source = "TIMEOUT, (RETRIES, *DELAYS) = 60, (3, 1, 2)\nCONFIG.value = 1\n"
+        symbol_map = _build_line_to_symbol_map(source=source)
+        names = [entry[2] for entry in symbol_map.top_level]
+        assert names == ["TIMEOUT", "RETRIES", "DELAYS"]
+
     def test_annotated_assignment(self):
         source = "FOO: int = 42\n"
         symbol_map = _build_line_to_symbol_map(source=source)
@@ -571,6 +594,34 @@ class TestCollectTestFunctionCalls:
         assert result is not None
         assert {"alpha", "beta", "gamma"}.issubset(result)
 
+    def test_file_with_utf8_bom(self, tmp_path: Path):
+        test_file = tmp_path / "test_example.py"
+        test_file.write_bytes(b"\xef\xbb\xbfdef test_bom():\n    helper()\n")
+        result = _collect_test_function_calls(
+            test_file=test_file,
+            test_name="test_bom",
+        )
+        assert result is not None
+        assert "helper" in result
+
+    def test_class_prefix_mismatch_returns_none(self, tmp_path: Path):
+        test_file = tmp_path / "test_example.py"
+        test_file.write_text(
+            textwrap.dedent("""\
+            class TestSuite:
+                def test_inner(self):
+                    helper()
+
+            def test_other():
+                other_func()
+        """)
+        )
+        result = _collect_test_function_calls(
+            test_file=test_file,
+            test_name="TestSuite::test_other",
+        )
+        assert result is None
+
 
 class TestIsFixtureDecoratorStandalone:
     def test_bare_fixture(self):
@@ -3080,3 +3131,662 @@ class TestPytestPluginsDetection:
         symbol_map = _build_line_to_symbol_map(source=source)
         symbol_names = {name for _, _, name in symbol_map.top_level}
         assert "pytest_plugins" in symbol_names, "pytest_plugins assignment should be tracked as a top-level symbol"
+
+
+class TestPrefetchBaseSources:
+    """Tests for batched base-branch file reads via git cat-file --batch."""
+
+    def test_parses_blobs_and_missing_objects(self, tmp_path: Path) -> None:
+        """Found blobs map to their content, missing paths map to None."""
+        stdout = (
+            b"c0ffee commit 5\ntree\n\n"
+            b"abc123 blob 12\ndef foo(): \n\nmain:utils/new.py missing\ndef456 blob 6\nX = 1\n\n"
+        )
+        mock_result = type("Result", (), {"returncode": 0, "stdout": stdout, "stderr": b""})()
+        with patch(
+            "scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run",
+            return_value=mock_result,
+        ) as mock_run:
+            result = _prefetch_base_sources(
+                relative_paths=["utils/old.py", "utils/new.py", "utils/const.py"],
+                base_branch="main",
+                repo_root=tmp_path,
+            )
+
+        assert mock_run.call_count == 1, "All paths should be read by a single git process"
+        assert mock_run.call_args.kwargs["input"] == (
+            b"main^{commit}\nmain:utils/old.py\nmain:utils/new.py\nmain:utils/const.py\n"
+        )
+        assert result == {"utils/old.py": "def foo(): \n", "utils/new.py": None, "utils/const.py": "X = 1\n"}
+
+    def test_unknown_base_branch_returns_empty_mapping(self, tmp_path: Path) -> None:
+        """Files are not reported as new when the base branch itself cannot be resolved."""
+        stdout = b"gone^{commit} missing\ngone:utils/old.py missing\n"
+        mock_result = type("Result", (), {"returncode": 0, "stdout": stdout, "stderr": b""})()
+        with patch(
+            "scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run",
+            return_value=mock_result,
+        ):
+            result = _prefetch_base_sources(
+                relative_paths=["utils/old.py"],
+                base_branch="gone",
+                repo_root=tmp_path,
+            )
+
+        assert result == {}
+
+    def test_git_failure_returns_empty_mapping(self, tmp_path: Path) -> None:
+        """When git cannot run, no paths are cached so callers fall back to git show."""
+        with patch(
+            "scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run",
+            side_effect=OSError("git not found"),
+        ):
+            result = _prefetch_base_sources(
+                relative_paths=["utils/old.py"],
+                base_branch="main",
+                repo_root=tmp_path,
+            )
+
+        assert result == {}
+
+    def test_old_file_symbols_use_prefetched_source(self, tmp_path: Path) -> None:
+        """_get_old_file_symbols reads from the prefetched cache without running git."""
+        file_path = tmp_path / "utils" / "helpers.py"
+        base_sources_cache: dict[str, str | None] = {
+            "utils/helpers.py": "class Helper:\n    def run(self):\n        pass\n\nTIMEOUT = 5\n",
+        }
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run") as mock_run:
+            result = _get_old_file_symbols(
+                file_path=file_path,
+                base_branch="main",
+                repo_root=tmp_path,
+                github_pr_info=None,
+                base_sources_cache=base_sources_cache,
+            )
+
+        mock_run.assert_not_called()
+        assert result == ({"Helper", "TIMEOUT"}, {"Helper": {"run"}})
+
+    def test_old_file_symbols_prefer_prefetched_source_over_github(self, tmp_path: Path) -> None:
+        """In checkout mode the prefetched base source is used instead of the Contents API."""
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.urllib.request.urlopen") as mock_urlopen:
+            result = _get_old_file_symbols(
+                file_path=tmp_path / "utils" / "helpers.py",
+                base_branch="main",
+                repo_root=tmp_path,
+                github_pr_info={"repo": "org/repo", "pr_number": 1, "token": None},
+                base_sources_cache={"utils/helpers.py": "def run():\n    pass\n"},
+            )
+
+        mock_urlopen.assert_not_called()
+        assert result == ({"run"}, {})
+
+    def test_old_file_symbols_include_unpacked_names(self, tmp_path: Path) -> None:
+        """Names bound by tuple unpacking in the base version are known symbols."""
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run") as mock_run:
+            result = _get_old_file_symbols(
+                file_path=tmp_path / "utils" / "consts.py",
+                base_branch="main",
+                repo_root=tmp_path,
+                github_pr_info=None,
+                base_sources_cache={"utils/consts.py": "HOST, PORT = 'localhost', 80\n"},
+            )
+
+        mock_run.assert_not_called()
+        assert result == ({"HOST", "PORT"}, {})
+
+    def test_old_file_symbols_missing_in_base_is_new_file(self, tmp_path: Path) -> None:
+        """A path cached as missing from the base branch is reported as a new file."""
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run") as mock_run:
+            result = _get_old_file_symbols(
+                file_path=tmp_path / "utils" / "new.py",
+                base_branch="main",
+                repo_root=tmp_path,
+                github_pr_info=None,
+                base_sources_cache={"utils/new.py": None},
+            )
+
+        mock_run.assert_not_called()
+        assert result == (set(), {})
+
+
+class TestGetAffectedFixturesHelper:
+    """Tests for transitive propagation of fixture modifications."""
+
+    def test_propagates_through_dependent_fixtures(self, tmp_path: Path) -> None:
+        """Fixtures requesting a modified fixture (directly or transitively) are affected."""
+        conftest = tmp_path / "conftest.py"
+        fixtures_dict = {
+            "base_vm": Fixture(name="base_vm", file_path=conftest),
+            "running_vm": Fixture(name="running_vm", file_path=conftest, fixture_deps={"base_vm"}),
+            "migrated_vm": Fixture(name="migrated_vm", file_path=conftest, fixture_deps={"running_vm"}),
+            "namespace": Fixture(name="namespace", file_path=conftest),
+        }
+        result = _get_affected_fixtures_helper(
+            modified_fixtures={"base_vm"},
+            modified_functions=set(),
+            fixtures_dict=fixtures_dict,
+        )
+        assert result == {"base_vm", "running_vm", "migrated_vm"}
+
+    def test_fixtures_calling_modified_functions_propagate(self, tmp_path: Path) -> None:
+        """Fixtures calling a modified function, and their dependents, are affected."""
+        conftest = tmp_path / "conftest.py"
+        fixtures_dict = {
+            "storage_class": Fixture(name="storage_class", file_path=conftest, function_calls={"get_storage"}),
+            "data_volume": Fixture(name="data_volume", file_path=conftest, fixture_deps={"storage_class"}),
+            "namespace": Fixture(name="namespace", file_path=conftest, function_calls={"create_ns"}),
+        }
+        modified_fixtures: set[str] = set()
+        result = _get_affected_fixtures_helper(
+            modified_fixtures=modified_fixtures,
+            modified_functions={"get_storage"},
+            fixtures_dict=fixtures_dict,
+        )
+        assert result == {"storage_class", "data_volume"}
+        assert modified_fixtures == set(), "Input set must not be mutated"
+
+
+class TestPrefetchLocalDiffs:
+    """Tests for batched local diffs via a single git diff."""
+
+    DIFF_OUTPUT = (
+        "diff --git a/utils/old.py b/utils/old.py\n"
+        "deleted file mode 100644\n"
+        "--- a/utils/old.py\n"
+        "+++ /dev/null\n"
+        "@@ -1,2 +0,0 @@\n"
+        "-def foo():\n"
+        "-    pass\n"
+        "diff --git a/utils/my helpers.py b/utils/my helpers.py\n"
+        "--- a/utils/my helpers.py\t\n"
+        "+++ b/utils/my helpers.py\t\n"
+        "@@ -1 +1,2 @@\n"
+        " X = 1\n"
+        "+Y = 2\n"
+        "diff --git a/logo.png b/logo.png\n"
+        "Binary files a/logo.png and b/logo.png differ\n"
+    )
+
+    def test_split_diff_by_file(self) -> None:
+        """Sections are keyed by path; deleted files use the old path, binary files are skipped."""
+        result = _split_diff_by_file(diff_output=self.DIFF_OUTPUT)
+
+        assert set(result) == {"utils/old.py", "utils/my helpers.py"}
+        assert "-def foo():" in result["utils/old.py"]
+        assert result["utils/my helpers.py"].endswith("+Y = 2\n")
+
+    def test_single_git_call(self, tmp_path: Path) -> None:
+        """All changed files are diffed by one git process."""
+        mock_result = type("Result", (), {"returncode": 0, "stdout": self.DIFF_OUTPUT, "stderr": ""})()
+        with patch(
+            "scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run",
+            return_value=mock_result,
+        ) as mock_run:
+            result = _prefetch_local_diffs(
+                relative_paths=["utils/old.py", "utils/my helpers.py"], base_branch="main", repo_root=tmp_path
+            )
+
+        assert mock_run.call_count == 1
+        git_args = mock_run.call_args.args[0]
+        assert "main...HEAD" in git_args
+        assert git_args[git_args.index("--") + 1 :] == ["utils/old.py", "utils/my helpers.py"]
+        assert set(result) == {"utils/old.py", "utils/my helpers.py"}
+
+    def test_git_failure_returns_empty_mapping(self, tmp_path: Path) -> None:
+        """A failing git diff leaves the cache empty so callers fall back to per-file diffs."""
+        mock_result = type("Result", (), {"returncode": 128, "stdout": "", "stderr": "bad revision"})()
+        with patch(
+            "scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run",
+            return_value=mock_result,
+        ):
+            result = _prefetch_local_diffs(relative_paths=["utils/old.py"], base_branch="missing", repo_root=tmp_path)
+
+        assert result == {}
+
+    def test_non_utf8_changed_file_outside_pathspec(self, tmp_path: Path) -> None:
+        """A Latin-1 file changed on the branch does not break the diff of the requested files."""
+        git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+        subprocess.run([*git, "init", "-q", "-b", "main"], cwd=tmp_path, check=True)
+        (tmp_path / "module.py").write_text("X = 1\n")
+        subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "base"], cwd=tmp_path, check=True)
+        subprocess.run([*git, "checkout", "-q", "-b", "feature"], cwd=tmp_path, check=True)
+        (tmp_path / "module.py").write_text("X = 2\n")
+        (tmp_path / "notes.txt").write_bytes("caf\u00e9\n".encode(encoding="latin-1"))
+        subprocess.run([*git, "add", "."], cwd=tmp_path, check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "change"], cwd=tmp_path, check=True)
+
+        result = _prefetch_local_diffs(relative_paths=["module.py"], base_branch="main", repo_root=tmp_path)
+
+        assert set(result) == {"module.py"}
+        assert "+X = 2" in result["module.py"]
+
+    def test_undecodable_output_returns_empty_mapping(self, tmp_path: Path) -> None:
+        """Non-UTF-8 diff output leaves the cache empty instead of aborting the analysis."""
+        with patch(
+            "scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run",
+            side_effect=UnicodeDecodeError("utf-8", b"\xe9", 0, 1, "invalid continuation byte"),
+        ):
+            result = _prefetch_local_diffs(relative_paths=["module.py"], base_branch="main", repo_root=tmp_path)
+
+        assert result == {}
+
+
+class TestFallbackDiscoverMarkedTests:
+    """Tests for AST-based fallback discovery of marked tests."""
+
+    def test_discovers_both_test_file_patterns_once(self, tmp_path: Path) -> None:
+        """test_*.py and *_test.py files are scanned; other modules are not."""
+        test_source = textwrap.dedent("""\
+            import pytest
+
+            @pytest.mark.smoke
+            def test_one():
+                pass
+        """)
+        tests_dir = tmp_path / "tests" / "network"
+        tests_dir.mkdir(parents=True)
+        (tests_dir / "test_alpha.py").write_text(test_source)
+        (tests_dir / "beta_test.py").write_text(test_source)
+        (tests_dir / "test_gamma_test.py").write_text(test_source)
+        (tests_dir / "helpers.py").write_text(test_source)
+
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+        analyzer._fallback_discover_marked_tests()
+
+        assert sorted(analyzer.marked_tests) == [
+            "tests/network/beta_test.py::test_one",
+            "tests/network/test_alpha.py::test_one",
+            "tests/network/test_gamma_test.py::test_one",
+        ]
+
+
+class TestNoPythonChangesFastPath:
+    """Changes outside marked-test dependencies skip dependency analysis and diff fetching."""
+
+    @patch("scripts.tests_analyzer.pytest_marker_analyzer.MarkerTestAnalyzer")
+    def test_local_mode_skips_dependency_analysis(self, mock_analyzer_cls: MagicMock) -> None:
+        """A docs-only change never builds the dependency graph."""
+        mock_analyzer = MagicMock()
+        mock_analyzer.marked_tests = ["test_something"]
+        mock_analyzer.get_changed_files.return_value = [Path("/repo/README.md")]
+        mock_analyzer_cls.return_value = mock_analyzer
+
+        _, exit_code = run_local_mode(args=argparse.Namespace(markers="smoke", base="main", files=None))
+
+        assert exit_code == 0
+        mock_analyzer.analyze_dependencies.assert_not_called()
+        mock_analyzer.analyze_impact.assert_called_once_with(changed_files=[Path("/repo/README.md")])
+
+    def test_analyze_impact_unrelated_change_fetches_no_diffs(self, tmp_path: Path) -> None:
+        """A changed file no marked test depends on returns without running git."""
+        test_file = tmp_path / "tests" / "test_vm.py"
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+        analyzer.marked_tests["tests/test_vm.py::test_vm"] = MarkedTest(
+            file_path=test_file,
+            test_name="test_vm",
+            node_id="tests/test_vm.py::test_vm",
+            dependencies={tmp_path / "utilities" / "vm.py"},
+        )
+
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run") as mock_run:
+            result = analyzer.analyze_impact(changed_files=[tmp_path / "utilities" / "storage.py"])
+
+        mock_run.assert_not_called()
+        assert result.should_run_tests is False
+        assert result.changed_files == ["utilities/storage.py"]
+        assert result.total_tests == 1
+
+
+class TestParseDiffForChangedLines:
+    """Tests for new-side line numbers reported by _parse_diff_for_changed_lines."""
+
+    def test_additions_context_and_deletions(self) -> None:
+        """Context advances the counter, deletions and headers do not."""
+        diff = (
+            "--- a/utils.py\n"
+            "+++ b/utils.py\n"
+            "@@ -10,4 +10,5 @@ def helper():\n"
+            " unchanged = 1\n"
+            "-removed = 2\n"
+            "+added = 2\n"
+            "+also_added = 3\n"
+            " trailing = 4\n"
+            "\\ No newline at end of file\n"
+            "@@ -40 +41 @@\n"
+            "+last = 5\n"
+        )
+        assert _parse_diff_for_changed_lines(diff_content=diff) == {11, 12, 41}
+
+    def test_lines_before_first_hunk_are_ignored(self) -> None:
+        """Git extended headers before the first hunk never count as changes."""
+        diff = "diff --git a/x.py b/x.py\nnew file mode 100644\n+++ b/x.py\n@@ -0,0 +1 @@\n+value = 1\n"
+        assert _parse_diff_for_changed_lines(diff_content=diff) == {1}
+
+
+class TestRunPytestCommand:
+    """Tests for pytest launcher selection in MarkerTestAnalyzer._run_pytest_command."""
+
+    def test_missing_launcher_is_not_retried(self, tmp_path: Path) -> None:
+        """Once direct pytest is missing, later runs go straight to uv."""
+        completed = MagicMock(returncode=0)
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+        with patch(
+            "scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run",
+            side_effect=[FileNotFoundError("pytest"), completed, completed],
+        ) as mock_run:
+            first = analyzer._run_pytest_command(args=["--collect-only"])
+            second = analyzer._run_pytest_command(args=["--setup-plan"])
+
+        assert first is completed
+        assert second is completed
+        assert [call.args[0] for call in mock_run.call_args_list] == [
+            ["pytest", "--collect-only"],
+            ["uv", "run", "pytest", "--collect-only"],
+            ["uv", "run", "pytest", "--setup-plan"],
+        ]
+
+
+class TestAnalyzeImpactCheckoutMode:
+    """Checkout mode reads PR-head sources from the cloned working tree."""
+
+    def test_pr_head_sha_not_fetched(self, tmp_path: Path) -> None:
+        """The PR head SHA, used only for Contents API reads, is not requested."""
+        helper_file = tmp_path / "utilities" / "vm.py"
+        helper_file.parent.mkdir(parents=True)
+        helper_file.write_text("def create_vm():\n    return 1\n")
+        analyzer = MarkerTestAnalyzer(
+            marker_expression="smoke",
+            repo_root=tmp_path,
+            github_pr_info={"repo": "org/repo", "pr_number": 1, "token": None},
+            is_checkout=True,
+        )
+        analyzer.marked_tests["tests/test_vm.py::test_vm"] = MarkedTest(
+            file_path=tmp_path / "tests" / "test_vm.py",
+            test_name="test_vm",
+            node_id="tests/test_vm.py::test_vm",
+            dependencies={helper_file},
+        )
+        diff = "@@ -1,2 +1,2 @@\n def create_vm():\n-    return 0\n+    return 1\n"
+        failed_git = type("Result", (), {"returncode": 1, "stdout": b"", "stderr": b""})()
+
+        with (
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._prefetch_pr_diffs",
+                return_value=({"utilities/vm.py": diff}, {"utilities/vm.py": "modified"}),
+            ),
+            patch("scripts.tests_analyzer.pytest_marker_analyzer._fetch_pr_head_sha") as mock_fetch_head,
+            patch("scripts.tests_analyzer.pytest_marker_analyzer._fetch_file_at_ref") as mock_fetch_file,
+            patch("scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run", return_value=failed_git),
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._get_old_file_symbols",
+                return_value=({"create_vm"}, {}),
+            ),
+        ):
+            result = analyzer.analyze_impact(changed_files=[helper_file])
+
+        mock_fetch_head.assert_not_called()
+        mock_fetch_file.assert_not_called()
+        assert result.changed_files == ["utilities/vm.py"]
+
+
+class TestAnalyzeImpactRemoteMode:
+    """Remote mode reuses the PR head SHA already returned by get_pr_info."""
+
+    def test_supplied_head_sha_is_not_refetched(self, tmp_path: Path) -> None:
+        """Head-side sources are fetched at the supplied SHA without another PR request."""
+        helper_file = tmp_path / "utilities" / "vm.py"
+        helper_file.parent.mkdir(parents=True)
+        helper_file.write_text("def create_vm():\n    return 1\n")
+        analyzer = MarkerTestAnalyzer(
+            marker_expression="smoke",
+            repo_root=tmp_path,
+            github_pr_info={"repo": "org/repo", "pr_number": 1, "token": None, "head_sha": "abc123"},
+        )
+        analyzer.marked_tests["tests/test_vm.py::test_vm"] = MarkedTest(
+            file_path=tmp_path / "tests" / "test_vm.py",
+            test_name="test_vm",
+            node_id="tests/test_vm.py::test_vm",
+            dependencies={helper_file},
+        )
+        diff = "@@ -1,2 +1,2 @@\n def create_vm():\n-    return 0\n+    return 1\n"
+        failed_git = type("Result", (), {"returncode": 1, "stdout": b"", "stderr": b""})()
+
+        with (
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._prefetch_pr_diffs",
+                return_value=({"utilities/vm.py": diff}, {"utilities/vm.py": "modified"}),
+            ),
+            patch("scripts.tests_analyzer.pytest_marker_analyzer._fetch_pr_head_sha") as mock_fetch_head,
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._fetch_file_at_ref",
+                return_value="def create_vm():\n    return 1\n",
+            ) as mock_fetch_file,
+            patch("scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run", return_value=failed_git),
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._get_old_file_symbols",
+                return_value=({"create_vm"}, {}),
+            ),
+        ):
+            analyzer.analyze_impact(changed_files=[helper_file])
+
+        mock_fetch_head.assert_not_called()
+        assert mock_fetch_file.call_args.kwargs["ref"] == "abc123"
+
+
+class TestValidateRepoName:
+    """Tests for memoized GitHub repo name validation."""
+
+    def test_valid_name_passes_repeatedly(self) -> None:
+        """A valid name is accepted on every call."""
+        assert validate_repo_name(repo="RedHatQE/openshift-virtualization-tests") is None
+        assert validate_repo_name(repo="RedHatQE/openshift-virtualization-tests") is None
+
+    def test_invalid_name_raises_on_every_call(self) -> None:
+        """Failures are never memoized as successes."""
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Invalid repo format"):
+                validate_repo_name(repo="owner/repo;rm")
+
+    def test_trailing_newline_rejected(self) -> None:
+        """A newline after an otherwise valid name is not accepted."""
+        with pytest.raises(ValueError, match="Contains invalid characters"):
+            validate_repo_name(repo="owner/repo\n")
+
+
+class TestGetChangedFiles:
+    """Tests for listing changed files from git in MarkerTestAnalyzer.get_changed_files."""
+
+    def test_nul_separated_paths_are_not_quoted(self, tmp_path: Path) -> None:
+        """Paths with spaces or non-ASCII characters come back verbatim."""
+        completed = MagicMock(returncode=0, stdout="tests/test_a.py\0docs/my file.md\0tests/tést_b.py\0")
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run", return_value=completed) as mock_run:
+            changed = analyzer.get_changed_files(base_branch="main")
+
+        assert "-z" in mock_run.call_args.args[0]
+        assert changed == [
+            tmp_path / "tests/test_a.py",
+            tmp_path / "docs/my file.md",
+            tmp_path / "tests/tést_b.py",
+        ]
+
+    def test_git_failure_returns_empty_list(self, tmp_path: Path) -> None:
+        """A failing git diff (e.g. unknown base branch) yields no changed files."""
+        failed = MagicMock(returncode=128, stdout="", stderr="fatal: bad revision 'missing...HEAD'\n")
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.subprocess.run", return_value=failed):
+            assert analyzer.get_changed_files(base_branch="missing") == []
+
+
+class TestFindRelevantConftestsHelper:
+    """Tests for memoized conftest discovery up the test's directory tree."""
+
+    def test_conftests_found_once_per_test_file(self, tmp_path: Path) -> None:
+        """Nested and root conftests are found, and repeat lookups skip the filesystem."""
+        test_file = tmp_path / "tests" / "network" / "test_net.py"
+        test_file.parent.mkdir(parents=True)
+        test_file.write_text("def test_net():\n    pass\n")
+        (tmp_path / "conftest.py").write_text("")
+        (tmp_path / "tests" / "network" / "conftest.py").write_text("")
+
+        first = _find_relevant_conftests_helper(test_file=test_file, repo_root=tmp_path)
+        with patch.object(Path, "exists") as mock_exists:
+            second = _find_relevant_conftests_helper(test_file=test_file, repo_root=tmp_path)
+
+        mock_exists.assert_not_called()
+        assert second is first
+        assert first == {
+            tmp_path.resolve() / "conftest.py",
+            tmp_path.resolve() / "tests" / "network" / "conftest.py",
+        }
+
+
+class TestScanPythonFiles:
+    """Tests for the scandir-based Python file walk."""
+
+    def test_skips_hidden_cache_and_symlinked_dirs(self, tmp_path: Path) -> None:
+        """Nested .py files are found; hidden, __pycache__ and symlinked dirs are not walked."""
+        (tmp_path / "network" / "l2").mkdir(parents=True)
+        (tmp_path / "network" / "l2" / "test_l2.py").write_text("")
+        (tmp_path / "network" / "conftest.py").write_text("")
+        (tmp_path / "network" / "README.md").write_text("")
+        (tmp_path / "network" / "__pycache__").mkdir()
+        (tmp_path / "network" / "__pycache__" / "stale.py").write_text("")
+        (tmp_path / ".venv").mkdir()
+        (tmp_path / ".venv" / "site.py").write_text("")
+        (tmp_path / "linked").symlink_to(target=tmp_path / "network", target_is_directory=True)
+
+        assert set(_scan_python_files(directory=tmp_path)) == {
+            tmp_path / "network" / "l2" / "test_l2.py",
+            tmp_path / "network" / "conftest.py",
+        }
+
+
+class TestTupleUnpackedSymbolImpact:
+    """Every name unpacked from a changed assignment counts as modified."""
+
+    def test_change_to_second_unpacked_name_flags_importing_test(self, tmp_path: Path) -> None:
+        """Changing PORT in ``HOST, PORT = ...`` flags a test that imports only PORT."""
+        consts_file = tmp_path / "consts.py"
+        consts_file.write_text('HOST, PORT = "a", 8080\n')
+        test_file = tmp_path / "tests" / "test_port.py"
+        test_file.parent.mkdir()
+        test_file.write_text("from consts import PORT\n\n\ndef test_port():\n    assert PORT\n")
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+        analyzer.marked_tests["tests/test_port.py::test_port"] = MarkedTest(
+            file_path=test_file,
+            test_name="test_port",
+            node_id="tests/test_port.py::test_port",
+            dependencies={test_file, consts_file},
+            symbol_imports={consts_file: {"PORT"}},
+        )
+        diff = '--- a/consts.py\n+++ b/consts.py\n@@ -1 +1 @@\n-HOST, PORT = "a", 80\n+HOST, PORT = "a", 8080\n'
+
+        with (
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._prefetch_local_diffs",
+                return_value={"consts.py": diff},
+            ),
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._prefetch_base_sources",
+                return_value={"consts.py": 'HOST, PORT = "a", 80\n'},
+            ),
+        ):
+            result = analyzer.analyze_impact(changed_files=[consts_file])
+
+        assert result.should_run_tests is True
+        assert [test["node_id"] for test in result.affected_tests] == ["tests/test_port.py::test_port"]
+
+
+class TestBaseIdenticalFiles:
+    """Changed files identical to the base branch are not treated as changed."""
+
+    def test_only_unchanged_existing_files_are_identical(self, tmp_path: Path) -> None:
+        """Files equal to base are identical; edited, new and deleted files are not."""
+        (tmp_path / "same.py").write_text("X = 1\n")
+        (tmp_path / "edited.py").write_text("X = 2\n")
+        (tmp_path / "new.py").write_text("X = 1\n")
+        candidate_files = [tmp_path / name for name in ("same.py", "edited.py", "new.py", "deleted.py")]
+
+        identical = _base_identical_files(
+            candidate_files=candidate_files,
+            base_sources_cache={"same.py": "X = 1\n", "edited.py": "X = 1\n", "new.py": None, "deleted.py": "X = 1\n"},
+            repo_root=tmp_path,
+        )
+
+        assert identical == {tmp_path / "same.py"}
+
+    def test_unchanged_file_via_opaque_conftest_import_not_flagged(self, tmp_path: Path) -> None:
+        """A base-identical file reached through a conftest is unaffected, as through direct imports."""
+        helper_file = tmp_path / "utilities" / "vm.py"
+        helper_file.parent.mkdir(parents=True)
+        helper_file.write_text("def create_vm():\n    return 1\n")
+        conftest_path = tmp_path / "tests" / "conftest.py"
+        conftest_path.parent.mkdir()
+        conftest_path.write_text("import utilities.vm\n")
+        test_file = tmp_path / "tests" / "test_vm.py"
+        test_file.write_text("def test_vm():\n    pass\n")
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+        analyzer.marked_tests["tests/test_vm.py::test_vm"] = MarkedTest(
+            file_path=test_file,
+            test_name="test_vm",
+            node_id="tests/test_vm.py::test_vm",
+            # helper_file is a dependency without symbol imports, so it is
+            # resolved through the conftest pathway
+            dependencies={test_file, conftest_path, helper_file},
+            fixtures={"vm"},
+        )
+        analyzer.conftest_opaque_deps = {conftest_path: {helper_file}}
+        # Were the file still treated as changed, this fixture calling the
+        # symbol in the merge-base diff would flag the test
+        analyzer.fixtures = {"vm": Fixture(name="vm", file_path=conftest_path, function_calls={"create_vm"})}
+        diff = "--- a/utilities/vm.py\n+++ b/utilities/vm.py\n@@ -2 +2 @@\n-    return 0\n+    return 1\n"
+
+        with (
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._prefetch_local_diffs",
+                return_value={"utilities/vm.py": diff},
+            ),
+            patch(
+                "scripts.tests_analyzer.pytest_marker_analyzer._prefetch_base_sources",
+                return_value={"utilities/vm.py": "def create_vm():\n    return 1\n"},
+            ),
+        ):
+            result = analyzer.analyze_impact(changed_files=[helper_file])
+
+        assert result.should_run_tests is False
+        assert result.affected_tests == []
+
+
+class TestParsePythonFileCache:
+    """Tests for the bounded, per-run parsed module cache."""
+
+    def test_least_recently_used_tree_is_evicted(self, tmp_path: Path) -> None:
+        """Past the size bound the oldest unused tree is dropped; recently used ones stay."""
+        files = [tmp_path / f"mod_{index}.py" for index in range(3)]
+        for index, file_path in enumerate(files):
+            file_path.write_text(f"X = {index}\n")
+
+        with patch("scripts.tests_analyzer.pytest_marker_analyzer.AST_CACHE_MAX_ENTRIES", 2):
+            first_tree = _parse_python_file(file_path=files[0])
+            _parse_python_file(file_path=files[1])
+            assert _parse_python_file(file_path=files[0]) is first_tree
+            _parse_python_file(file_path=files[2])
+
+        cached_paths = {cache_key[0] for cache_key in _AST_CACHE}
+        assert files[0] in cached_paths
+        assert files[1] not in cached_paths
+        assert files[2] in cached_paths
+
+    def test_cache_cleared_after_analyze_impact(self, tmp_path: Path) -> None:
+        """Trees parsed during a run are released when analyze_impact returns."""
+        module_file = tmp_path / "module.py"
+        module_file.write_text("X = 1\n")
+        _parse_python_file(file_path=module_file)
+        analyzer = MarkerTestAnalyzer(marker_expression="smoke", repo_root=tmp_path)
+
+        analyzer.analyze_impact(changed_files=[module_file])
+
+        assert not _AST_CACHE